@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from aws_durable_execution_sdk_python.lambda_service import (
     OperationAction,
@@ -38,7 +38,9 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+    from collections.abc import Callable, Mapping, MutableMapping
+
+    from aws_durable_execution_sdk_python.lambda_service import Operation
 
     from aws_durable_execution_sdk_python_testing.execution import Execution
 
@@ -48,6 +50,16 @@ MAX_ERROR_PAYLOAD_SIZE_BYTES = 32768
 class CheckpointValidator:
     """Validates checkpoint input based on current state."""
 
+    _STATUS_TRANSITION_VALIDATORS: ClassVar[
+        dict[OperationType, Callable[[Operation | None, OperationUpdate], None]]
+    ] = {
+        OperationType.STEP: StepOperationValidator.validate,
+        OperationType.CONTEXT: ContextOperationValidator.validate,
+        OperationType.WAIT: WaitOperationValidator.validate,
+        OperationType.CALLBACK: CallbackOperationValidator.validate,
+        OperationType.CHAINED_INVOKE: ChainedInvokeOperationValidator.validate,
+    }
+
     @staticmethod
     def validate_input(updates: list[OperationUpdate], execution: Execution) -> None:
         """Perform validation on the given input based on the current state."""
@@ -55,10 +67,20 @@ class CheckpointValidator:
             return
 
         CheckpointValidator._validate_conflicting_execution_update(updates)
-        CheckpointValidator._validate_parent_id_and_duplicate_id(updates, execution)
 
+        # index existing operations once, shared by the parent-id and per-update checks
+        operations_by_id: dict[str, Operation] = {
+            operation.operation_id: operation for operation in execution.operations
+        }
+        CheckpointValidator._validate_parent_id_and_duplicate_id(
+            updates, operations_by_id
+        )
+
+        # bind to locals: these are called once per update
+        validate_operation_update = CheckpointValidator._validate_operation_update
+        get_current_state = operations_by_id.get
         for update in updates:
-            CheckpointValidator._validate_operation_update(update, execution)
+            validate_operation_update(update, get_current_state(update.operation_id))
 
     @staticmethod
     def _validate_conflicting_execution_update(updates: list[OperationUpdate]) -> None:
@@ -81,15 +103,17 @@ class CheckpointValidator:
 
     @staticmethod
     def _validate_operation_update(
-        update: OperationUpdate, execution: Execution
+        update: OperationUpdate, current_state: Operation | None
     ) -> None:
-        """Validate a single operation update."""
-        CheckpointValidator._validate_inconsistent_operation_metadata(update, execution)
+        """Validate a single operation update against its existing operation."""
+        CheckpointValidator._validate_inconsistent_operation_metadata(
+            update, current_state
+        )
         CheckpointValidator._validate_payload_sizes(update)
         ValidActionsByOperationTypeValidator.validate(
             update.operation_type, update.action
         )
-        CheckpointValidator._validate_operation_status_transition(update, execution)
+        CheckpointValidator._validate_operation_status_transition(update, current_state)
 
     @staticmethod
     def _validate_payload_sizes(update: OperationUpdate) -> None:
@@ -102,44 +126,28 @@ class CheckpointValidator:
 
     @staticmethod
     def _validate_operation_status_transition(
-        update: OperationUpdate, execution: Execution
+        update: OperationUpdate, current_state: Operation | None
     ) -> None:
         """Validate that the operation status transition is valid."""
-        current_state = None
-        for operation in execution.operations:
-            if operation.operation_id == update.operation_id:
-                current_state = operation
-                break
-
-        match update.operation_type:
-            case OperationType.STEP:
-                StepOperationValidator.validate(current_state, update)
-            case OperationType.CONTEXT:
-                ContextOperationValidator.validate(current_state, update)
-            case OperationType.WAIT:
-                WaitOperationValidator.validate(current_state, update)
-            case OperationType.CALLBACK:
-                CallbackOperationValidator.validate(current_state, update)
-            case OperationType.CHAINED_INVOKE:
-                ChainedInvokeOperationValidator.validate(current_state, update)
-            case OperationType.EXECUTION:
-                ExecutionOperationValidator.validate(update)
-            case _:  # pragma: no cover
-                msg: str = "Invalid operation type."
+        if update.operation_type == OperationType.EXECUTION:
+            ExecutionOperationValidator.validate(update)
+            return
 
-                raise InvalidParameterValueException(msg)
+        validator = CheckpointValidator._STATUS_TRANSITION_VALIDATORS.get(
+            update.operation_type
+        )
+        if validator is None:  # pragma: no cover
+            msg: str = "Invalid operation type."
+
+            raise InvalidParameterValueException(msg)
+
+        validator(current_state, update)
 
     @staticmethod
     def _validate_inconsistent_operation_metadata(
-        update: OperationUpdate, execution: Execution
+        update: OperationUpdate, current_state: Operation | None
     ) -> None:
         """Validate that operation metadata is consistent with existing operation."""
-        current_state = None
-        for operation in execution.operations:
-            if operation.operation_id == update.operation_id:
-                current_state = operation
-                break
-
         if current_state is not None:
             if (
                 update.operation_type is not None
@@ -168,7 +176,7 @@ class CheckpointValidator:
 
     @staticmethod
     def _validate_parent_id_and_duplicate_id(
-        updates: list[OperationUpdate], execution: Execution
+        updates: list[OperationUpdate], operations_by_id: Mapping[str, Operation]
     ) -> None:
         """Validate parent IDs and check for duplicate operation IDs.
 
@@ -178,17 +186,19 @@ class CheckpointValidator:
         operations_started: MutableMapping[str, OperationUpdate] = {}
         last_updates_seen: MutableMapping[str, OperationUpdate] = {}
 
+        # bind to locals: these are called once per update
+        is_invalid_duplicate_update = CheckpointValidator._is_invalid_duplicate_update
+        is_valid_parent_for_update = CheckpointValidator._is_valid_parent_for_update
+
         for update in updates:
-            if CheckpointValidator._is_invalid_duplicate_update(
-                update, last_updates_seen
-            ):
+            if is_invalid_duplicate_update(update, last_updates_seen):
                 msg_duplicate: str = (
                     "Cannot checkpoint multiple operations with the same ID."
                 )
                 raise InvalidParameterValueException(msg_duplicate)
 
-            if not CheckpointValidator._is_valid_parent_for_update(
-                execution, update, operations_started
+            if not is_valid_parent_for_update(
+                operations_by_id, update, operations_started
             ):
                 msg_parent: str = "Invalid parent operation id."
                 raise InvalidParameterValueException(msg_parent)
@@ -219,7 +229,7 @@ class CheckpointValidator:
 
     @staticmethod
     def _is_valid_parent_for_update(
-        execution: Execution,
+        operations_by_id: Mapping[str, Operation],
         update: OperationUpdate,
         operations_started: MutableMapping[str, OperationUpdate],
     ) -> bool:
@@ -235,8 +245,8 @@ class CheckpointValidator:
             return parent_update.operation_type == OperationType.CONTEXT
 
         # Check if parent exists in current execution state
-        for operation in execution.operations:
-            if operation.operation_id == parent_id:
-                return operation.operation_type == OperationType.CONTEXT
+        parent_operation = operations_by_id.get(parent_id)
+        if parent_operation is not None:
+            return parent_operation.operation_type == OperationType.CONTEXT
 
         return False
@@ -0,0 +1,60 @@
+"""Shared fixtures for checkpoint tests."""
+
+import json
+
+import pytest
+
+from aws_durable_execution_sdk_python_testing.execution import Execution
+from aws_durable_execution_sdk_python_testing.model import StartDurableExecutionInput
+
+
+_INPUT_JSON = json.dumps({"test": "data"})
+
+
+@pytest.fixture(scope="session")
+def start_input() -> StartDurableExecutionInput:
+    """Create the start input shared by the test executions."""
+    return StartDurableExecutionInput(
+        account_id="123456789012",
+        function_name="test-function",
+        function_qualifier="$LATEST",
+        execution_name="test-execution",
+        execution_timeout_seconds=900,
+        execution_retention_period_days=7,
+        input=_INPUT_JSON,
+        invocation_id="test-invocation-id",
+    )
+
+
+@pytest.fixture
+def execution_raw(start_input) -> Execution:
+    """Create a test execution that has not been started.
+
+    Use this for tests that only validate the shape of the update batch and
+    do not depend on the EXECUTION operation being present.
+    """
+    return Execution.new(start_input)
+
+
+@pytest.fixture(scope="module")
+def base_execution(start_input) -> Execution:
+    """Create a started execution once per module to copy from."""
+    execution = Execution.new(start_input)
+    execution.start()
+    return execution
+
+
+@pytest.fixture
+def execution(base_execution) -> Execution:
+    """Create a started test execution.
+
+    Copies the module-scoped base execution with its own operations list so
+    tests can append operations without leaking state into each other.
+    """
+    # the base must only ever hold the EXECUTION operation added by start()
+    assert len(base_execution.operations) == 1
+    return Execution(
+        durable_execution_arn=base_execution.durable_execution_arn,
+        start_input=base_execution.start_input,
+        operations=list(base_execution.operations),
+    )
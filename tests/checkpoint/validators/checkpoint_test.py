@@ -1,6 +1,7 @@
 """Unit tests for checkpoint validator."""
 
-import json
+import re
+from unittest.mock import Mock
 
 import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
@@ -20,35 +21,98 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
     InvalidParameterValueException,
 )
 from aws_durable_execution_sdk_python_testing.execution import Execution
-from aws_durable_execution_sdk_python_testing.model import StartDurableExecutionInput
-
-
-def _create_test_execution() -> Execution:
-    """Create a test execution with basic setup."""
-    start_input = StartDurableExecutionInput(
-        account_id="123456789012",
-        function_name="test-function",
-        function_qualifier="$LATEST",
-        execution_name="test-execution",
-        execution_timeout_seconds=900,
-        execution_retention_period_days=7,
-        input=json.dumps({"test": "data"}),
-        invocation_id="test-invocation-id",
-    )
-    execution = Execution.new(start_input)
-    execution.start()
-    return execution
 
 
-def test_validate_input_empty_updates():
+_ERR_MULTIPLE_EXECUTION = re.compile(r"Cannot checkpoint multiple EXECUTION updates")
+_ERR_EXECUTION_NOT_LAST = re.compile(r"EXECUTION checkpoint must be the last update")
+_ERR_TOO_LARGE = re.compile(
+    rf"Error object size must be less than {MAX_ERROR_PAYLOAD_SIZE_BYTES} bytes"
+)
+_ERR_DUPLICATE_ID = re.compile(
+    r"Cannot checkpoint multiple operations with the same ID"
+)
+_ERR_INVALID_PARENT = re.compile(r"Invalid parent operation id")
+_ERR_INCONSISTENT_TYPE = re.compile(r"Inconsistent operation type")
+_ERR_INCONSISTENT_SUBTYPE = re.compile(r"Inconsistent operation subtype")
+_ERR_INCONSISTENT_NAME = re.compile(r"Inconsistent operation name")
+_ERR_INCONSISTENT_PARENT = re.compile(r"Inconsistent parent operation id")
+
+_EXEC_SUCCEED = OperationUpdate(
+    operation_id="exec-1",
+    operation_type=OperationType.EXECUTION,
+    action=OperationAction.SUCCEED,
+)
+_CONTEXT_START = OperationUpdate(
+    operation_id="context-1",
+    operation_type=OperationType.CONTEXT,
+    action=OperationAction.START,
+)
+_CONTEXT_SUCCEED = OperationUpdate(
+    operation_id="context-1",
+    operation_type=OperationType.CONTEXT,
+    action=OperationAction.SUCCEED,
+)
+_STEP_START = OperationUpdate(
+    operation_id="step-1",
+    operation_type=OperationType.STEP,
+    action=OperationAction.START,
+)
+_STEP_SUCCEED = OperationUpdate(
+    operation_id="step-1",
+    operation_type=OperationType.STEP,
+    action=OperationAction.SUCCEED,
+)
+_WAIT_CANCEL = OperationUpdate(
+    operation_id="wait-1",
+    operation_type=OperationType.WAIT,
+    action=OperationAction.CANCEL,
+)
+_STEP_FAIL_OVERSIZED = OperationUpdate(
+    operation_id="step-1",
+    operation_type=OperationType.STEP,
+    action=OperationAction.FAIL,
+    error=ErrorObject(
+        message="x" * (MAX_ERROR_PAYLOAD_SIZE_BYTES + 1),
+        type="TestError",
+        data=None,
+        stack_trace=None,
+    ),
+)
+
+
+class _SinglePassList(list):
+    """A list that fails the test if it is iterated more than once."""
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._iterated = False
+
+    def __iter__(self):
+        assert not self._iterated, "operations were scanned more than once"
+        self._iterated = True
+        return super().__iter__()
+
+
+def _add_ops(execution: Execution, *ops: Operation) -> None:
+    """Add existing operations to the execution under test."""
+    execution.operations.extend(ops)
+
+
+def test_validate_input_empty_updates(execution_raw):
     """Test validation with empty updates list."""
-    execution = _create_test_execution()
+    CheckpointValidator.validate_input([], execution_raw)
+
+
+def test_validate_input_empty_updates_does_not_touch_execution():
+    """Test validation returns before reading execution state for empty updates."""
+    # spec=[] makes any attribute access, e.g. execution.operations, raise
+    execution = Mock(spec=[])
+
     CheckpointValidator.validate_input([], execution)
 
 
-def test_validate_input_single_valid_update():
+def test_validate_input_single_valid_update(execution_raw):
     """Test validation with single valid update."""
-    execution = _create_test_execution()
     updates = [
         OperationUpdate(
             operation_id="test-step-id",
@@ -56,18 +120,13 @@ def test_validate_input_single_valid_update():
             action=OperationAction.START,
         )
     ]
-    CheckpointValidator.validate_input(updates, execution)
+    CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_conflicting_execution_update_multiple():
+def test_validate_conflicting_execution_update_multiple(execution_raw):
     """Test validation fails with multiple execution updates."""
-    execution = _create_test_execution()
     updates = [
-        OperationUpdate(
-            operation_id="exec-1",
-            operation_type=OperationType.EXECUTION,
-            action=OperationAction.SUCCEED,
-        ),
+        _EXEC_SUCCEED,
         OperationUpdate(
             operation_id="exec-2",
             operation_type=OperationType.EXECUTION,
@@ -77,81 +136,41 @@ def test_validate_conflicting_execution_update_multiple():
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot checkpoint multiple EXECUTION updates",
+        match=_ERR_MULTIPLE_EXECUTION,
     ):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_conflicting_execution_update_not_last():
+def test_validate_conflicting_execution_update_not_last(execution_raw):
     """Test validation fails when execution update is not last."""
-    execution = _create_test_execution()
-    updates = [
-        OperationUpdate(
-            operation_id="exec-1",
-            operation_type=OperationType.EXECUTION,
-            action=OperationAction.SUCCEED,
-        ),
-        OperationUpdate(
-            operation_id="step-1",
-            operation_type=OperationType.STEP,
-            action=OperationAction.START,
-        ),
-    ]
+    updates = [_EXEC_SUCCEED, _STEP_START]
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="EXECUTION checkpoint must be the last update",
+        match=_ERR_EXECUTION_NOT_LAST,
     ):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_execution_update_as_last():
+def test_validate_execution_update_as_last(execution_raw):
     """Test validation passes when execution update is last."""
-    execution = _create_test_execution()
-    updates = [
-        OperationUpdate(
-            operation_id="step-1",
-            operation_type=OperationType.STEP,
-            action=OperationAction.START,
-        ),
-        OperationUpdate(
-            operation_id="exec-1",
-            operation_type=OperationType.EXECUTION,
-            action=OperationAction.SUCCEED,
-        ),
-    ]
-    CheckpointValidator.validate_input(updates, execution)
+    updates = [_STEP_START, _EXEC_SUCCEED]
+    CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_payload_sizes_error_too_large():
+def test_validate_payload_sizes_error_too_large(execution_raw):
     """Test validation fails when error payload is too large."""
-    execution = _create_test_execution()
-
-    large_message = "x" * (MAX_ERROR_PAYLOAD_SIZE_BYTES + 1)
-    large_error = ErrorObject(
-        message=large_message, type="TestError", data=None, stack_trace=None
-    )
-
-    updates = [
-        OperationUpdate(
-            operation_id="step-1",
-            operation_type=OperationType.STEP,
-            action=OperationAction.FAIL,
-            error=large_error,
-        )
-    ]
+    updates = [_STEP_FAIL_OVERSIZED]
 
     with pytest.raises(
         InvalidParameterValueException,
-        match=f"Error object size must be less than {MAX_ERROR_PAYLOAD_SIZE_BYTES} bytes",
+        match=_ERR_TOO_LARGE,
     ):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_payload_sizes_error_within_limit():
+def test_validate_payload_sizes_error_within_limit(execution_raw):
     """Test validation passes when error payload is within limit."""
-    execution = _create_test_execution()
-
     small_error = ErrorObject(
         message="Small error", type="TestError", data=None, stack_trace=None
     )
@@ -163,17 +182,16 @@ def test_validate_payload_sizes_error_within_limit():
             error=small_error,
         )
     ]
-    CheckpointValidator.validate_input(updates, execution)
+    CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_duplicate_operation_ids():
+def test_validate_duplicate_operation_ids(execution_raw):
     """Test validation allows duplicate operation IDs in same batch.
 
     With background batching, the SDK can send multiple updates for the same
     operation in a single batch (e.g., START followed by SUCCEED). This is
     valid behavior and should be allowed.
     """
-    execution = _create_test_execution()
     updates = [
         OperationUpdate(
             operation_id="duplicate-id",
@@ -188,19 +206,35 @@ def test_validate_duplicate_operation_ids():
     ]
 
     # Should not raise - duplicate operation IDs are allowed in batches
-    CheckpointValidator.validate_input(updates, execution)
+    CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_valid_parent_id_in_execution():
-    """Test validation passes with valid parent ID from execution."""
-    execution = _create_test_execution()
+def test_validate_duplicate_operation_id_last_in_batch(execution_raw):
+    """Test a repeated START is rejected when it comes after other updates."""
+    updates = [
+        OperationUpdate(
+            operation_id=operation_id,
+            operation_type=OperationType.STEP,
+            action=OperationAction.START,
+        )
+        for operation_id in ("step-1", "step-2", "step-1")
+    ]
 
+    with pytest.raises(
+        InvalidParameterValueException,
+        match=_ERR_DUPLICATE_ID,
+    ):
+        CheckpointValidator.validate_input(updates, execution_raw)
+
+
+def test_validate_valid_parent_id_in_execution(execution):
+    """Test validation passes with valid parent ID from execution."""
     context_op = Operation(
         operation_id="context-1",
         operation_type=OperationType.CONTEXT,
         status=OperationStatus.STARTED,
     )
-    execution.operations.append(context_op)
+    _add_ops(execution, context_op)
 
     updates = [
         OperationUpdate(
@@ -213,35 +247,58 @@ def test_validate_valid_parent_id_in_execution():
     CheckpointValidator.validate_input(updates, execution)
 
 
-def test_validate_valid_parent_id_in_updates():
+def test_validate_valid_parent_id_in_updates(execution_raw):
     """Test validation passes with valid parent ID from updates."""
-    execution = _create_test_execution()
     updates = [
+        _CONTEXT_START,
         OperationUpdate(
-            operation_id="context-1",
-            operation_type=OperationType.CONTEXT,
+            operation_id="step-1",
+            operation_type=OperationType.STEP,
             action=OperationAction.START,
+            parent_id="context-1",
         ),
+    ]
+    CheckpointValidator.validate_input(updates, execution_raw)
+
+
+def test_validate_parent_id_scans_existing_operations_once(execution):
+    """Test existing operations are scanned once, not once per update."""
+    execution.operations = _SinglePassList(
+        [
+            *execution.operations,
+            Operation(
+                operation_id="step-1",
+                operation_type=OperationType.STEP,
+                status=OperationStatus.STARTED,
+            ),
+            Operation(
+                operation_id="context-1",
+                operation_type=OperationType.CONTEXT,
+                status=OperationStatus.STARTED,
+            ),
+        ]
+    )
+    updates = [
         OperationUpdate(
-            operation_id="step-1",
+            operation_id=operation_id,
             operation_type=OperationType.STEP,
             action=OperationAction.START,
             parent_id="context-1",
-        ),
+        )
+        for operation_id in ("child-1", "child-2")
     ]
+
     CheckpointValidator.validate_input(updates, execution)
 
 
-def test_validate_invalid_parent_id_wrong_type():
+def test_validate_invalid_parent_id_wrong_type(execution):
     """Test validation fails with parent ID of wrong operation type."""
-    execution = _create_test_execution()
-
     step_op = Operation(
         operation_id="step-parent",
         operation_type=OperationType.STEP,
         status=OperationStatus.STARTED,
     )
-    execution.operations.append(step_op)
+    _add_ops(execution, step_op)
 
     updates = [
         OperationUpdate(
@@ -252,15 +309,12 @@ def test_validate_invalid_parent_id_wrong_type():
         )
     ]
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Invalid parent operation id"
-    ):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_INVALID_PARENT):
         CheckpointValidator.validate_input(updates, execution)
 
 
-def test_validate_invalid_parent_id_not_found():
+def test_validate_invalid_parent_id_not_found(execution_raw):
     """Test validation fails with parent ID that doesn't exist."""
-    execution = _create_test_execution()
     updates = [
         OperationUpdate(
             operation_id="step-1",
@@ -270,15 +324,12 @@ def test_validate_invalid_parent_id_not_found():
         )
     ]
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Invalid parent operation id"
-    ):
-        CheckpointValidator.validate_input(updates, execution)
+    with pytest.raises(InvalidParameterValueException, match=_ERR_INVALID_PARENT):
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_no_parent_id():
+def test_validate_no_parent_id(execution_raw):
     """Test validation passes with no parent ID."""
-    execution = _create_test_execution()
     updates = [
         OperationUpdate(
             operation_id="step-1",
@@ -287,117 +338,60 @@ def test_validate_no_parent_id():
             parent_id=None,
         )
     ]
-    CheckpointValidator.validate_input(updates, execution)
-
-
-def test_validate_operation_status_transition_step():
-    """Test validation calls step validator for STEP operations."""
-    execution = _create_test_execution()
-
-    step_op = Operation(
-        operation_id="step-1",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.READY,
-    )
-    execution.operations.append(step_op)
-
-    updates = [
-        OperationUpdate(
-            operation_id="step-1",
-            operation_type=OperationType.STEP,
-            action=OperationAction.START,
-        )
-    ]
-    CheckpointValidator.validate_input(updates, execution)
-
-
-def test_validate_operation_status_transition_context():
-    """Test validation calls context validator for CONTEXT operations."""
-    execution = _create_test_execution()
-
-    context_op = Operation(
-        operation_id="context-1",
-        operation_type=OperationType.CONTEXT,
-        status=OperationStatus.STARTED,
-    )
-    execution.operations.append(context_op)
-
-    updates = [
-        OperationUpdate(
-            operation_id="context-1",
-            operation_type=OperationType.CONTEXT,
-            action=OperationAction.SUCCEED,
-        )
-    ]
-    CheckpointValidator.validate_input(updates, execution)
+    CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_operation_status_transition_wait():
-    """Test validation calls wait validator for WAIT operations."""
-    execution = _create_test_execution()
-
-    wait_op = Operation(
-        operation_id="wait-1",
-        operation_type=OperationType.WAIT,
-        status=OperationStatus.STARTED,
-    )
-    execution.operations.append(wait_op)
-
-    updates = [
-        OperationUpdate(
-            operation_id="wait-1",
-            operation_type=OperationType.WAIT,
-            action=OperationAction.CANCEL,
-        )
-    ]
-    CheckpointValidator.validate_input(updates, execution)
+_STATUS_TRANSITION_CASES = [
+    (OperationType.STEP, OperationStatus.READY, OperationAction.START),
+    (OperationType.CONTEXT, OperationStatus.STARTED, OperationAction.SUCCEED),
+    (OperationType.WAIT, OperationStatus.STARTED, OperationAction.CANCEL),
+    (OperationType.CHAINED_INVOKE, OperationStatus.STARTED, OperationAction.CANCEL),
+]
 
 
-def test_validate_operation_status_transition_invoke():
-    """Test validation calls invoke validator for INVOKE operations."""
-    execution = _create_test_execution()
-
-    invoke_op = Operation(
-        operation_id="invoke-1",
-        operation_type=OperationType.CHAINED_INVOKE,
-        status=OperationStatus.STARTED,
+@pytest.mark.parametrize(
+    ("operation_type", "status", "action"),
+    _STATUS_TRANSITION_CASES,
+    ids=[case[0].value for case in _STATUS_TRANSITION_CASES],
+)
+def test_validate_operation_status_transition(
+    execution, operation_type, status, action
+):
+    """Test validation routes existing operations to the per-type validator."""
+    _add_ops(
+        execution,
+        Operation(
+            operation_id="op-1",
+            operation_type=operation_type,
+            status=status,
+        ),
     )
-    execution.operations.append(invoke_op)
 
     updates = [
         OperationUpdate(
-            operation_id="invoke-1",
-            operation_type=OperationType.CHAINED_INVOKE,
-            action=OperationAction.CANCEL,
+            operation_id="op-1",
+            operation_type=operation_type,
+            action=action,
         )
     ]
     CheckpointValidator.validate_input(updates, execution)
 
 
-def test_validate_operation_status_transition_execution():
+def test_validate_operation_status_transition_execution(execution_raw):
     """Test validation calls execution validator for EXECUTION operations."""
-    execution = _create_test_execution()
-    updates = [
-        OperationUpdate(
-            operation_id="exec-1",
-            operation_type=OperationType.EXECUTION,
-            action=OperationAction.SUCCEED,
-        )
-    ]
-    CheckpointValidator.validate_input(updates, execution)
+    updates = [_EXEC_SUCCEED]
+    CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_inconsistent_operation_type():
+def test_validate_inconsistent_operation_type(execution):
     """Test validation fails when operation type is inconsistent."""
-    execution = _create_test_execution()
-
     # Add existing operation
     step_op = Operation(
         operation_id="op-1",
         operation_type=OperationType.STEP,
         status=OperationStatus.STARTED,
     )
-    execution.operations.append(step_op)
+    _add_ops(execution, step_op)
 
     # Try to update with different type
     updates = [
@@ -408,16 +402,12 @@ def test_validate_inconsistent_operation_type():
         )
     ]
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Inconsistent operation type"
-    ):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_INCONSISTENT_TYPE):
         CheckpointValidator.validate_input(updates, execution)
 
 
-def test_validate_inconsistent_operation_subtype():
+def test_validate_inconsistent_operation_subtype(execution):
     """Test validation fails when operation subtype is inconsistent."""
-    execution = _create_test_execution()
-
     # Add existing operation with subtype
     from aws_durable_execution_sdk_python.lambda_service import OperationSubType
 
@@ -427,7 +417,7 @@ def test_validate_inconsistent_operation_subtype():
         status=OperationStatus.STARTED,
         sub_type=OperationSubType.PARALLEL,
     )
-    execution.operations.append(context_op)
+    _add_ops(execution, context_op)
 
     # Try to update with different subtype
     updates = [
@@ -439,16 +429,12 @@ def test_validate_inconsistent_operation_subtype():
         )
     ]
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Inconsistent operation subtype"
-    ):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_INCONSISTENT_SUBTYPE):
         CheckpointValidator.validate_input(updates, execution)
 
 
-def test_validate_inconsistent_operation_name():
+def test_validate_inconsistent_operation_name(execution):
     """Test validation fails when operation name is inconsistent."""
-    execution = _create_test_execution()
-
     # Add existing operation with name
     step_op = Operation(
         operation_id="op-1",
@@ -456,7 +442,7 @@ def test_validate_inconsistent_operation_name():
         status=OperationStatus.STARTED,
         name="original_name",
     )
-    execution.operations.append(step_op)
+    _add_ops(execution, step_op)
 
     # Try to update with different name
     updates = [
@@ -468,30 +454,26 @@ def test_validate_inconsistent_operation_name():
         )
     ]
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Inconsistent operation name"
-    ):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_INCONSISTENT_NAME):
         CheckpointValidator.validate_input(updates, execution)
 
 
-def test_validate_inconsistent_parent_operation_id():
+def test_validate_inconsistent_parent_operation_id(execution):
     """Test validation fails when parent operation ID is inconsistent."""
-    execution = _create_test_execution()
-
     # Add TWO context operations
     context_op1 = Operation(
         operation_id="context-1",
         operation_type=OperationType.CONTEXT,
         status=OperationStatus.STARTED,
     )
-    execution.operations.append(context_op1)
+    _add_ops(execution, context_op1)
 
     context_op2 = Operation(
         operation_id="context-2",
         operation_type=OperationType.CONTEXT,
         status=OperationStatus.STARTED,
     )
-    execution.operations.append(context_op2)
+    _add_ops(execution, context_op2)
 
     # Add existing step with parent context-1
     step_op = Operation(
@@ -500,7 +482,7 @@ def test_validate_inconsistent_parent_operation_id():
         status=OperationStatus.STARTED,
         parent_id="context-1",
     )
-    execution.operations.append(step_op)
+    _add_ops(execution, step_op)
 
     # Try to update with different parent context-2 (which exists, so passes parent validation)
     updates = [
@@ -512,16 +494,12 @@ def test_validate_inconsistent_parent_operation_id():
         )
     ]
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Inconsistent parent operation id"
-    ):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_INCONSISTENT_PARENT):
         CheckpointValidator.validate_input(updates, execution)
 
 
-def test_validate_invalid_duplicate_wait_operations():
+def test_validate_invalid_duplicate_wait_operations(execution_raw):
     """Test validation fails with duplicate WAIT operations."""
-    execution = _create_test_execution()
-
     # WAIT operations cannot have duplicate updates in same batch
     updates = [
         OperationUpdate(
@@ -529,24 +507,18 @@ def test_validate_invalid_duplicate_wait_operations():
             operation_type=OperationType.WAIT,
             action=OperationAction.START,
         ),
-        OperationUpdate(
-            operation_id="wait-1",
-            operation_type=OperationType.WAIT,
-            action=OperationAction.CANCEL,
-        ),
+        _WAIT_CANCEL,
     ]
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot checkpoint multiple operations with the same ID",
+        match=_ERR_DUPLICATE_ID,
     ):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_invalid_duplicate_callback_operations():
+def test_validate_invalid_duplicate_callback_operations(execution_raw):
     """Test validation fails with duplicate CALLBACK operations."""
-    execution = _create_test_execution()
-
     # CALLBACK operations cannot have duplicate updates in same batch
     updates = [
         OperationUpdate(
@@ -563,15 +535,13 @@ def test_validate_invalid_duplicate_callback_operations():
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot checkpoint multiple operations with the same ID",
+        match=_ERR_DUPLICATE_ID,
     ):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_invalid_duplicate_invoke_operations():
+def test_validate_invalid_duplicate_invoke_operations(execution_raw):
     """Test validation fails with duplicate CHAINED_INVOKE operations."""
-    execution = _create_test_execution()
-
     # CHAINED_INVOKE operations cannot have duplicate updates in same batch
     updates = [
         OperationUpdate(
@@ -588,101 +558,49 @@ def test_validate_invalid_duplicate_invoke_operations():
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot checkpoint multiple operations with the same ID",
+        match=_ERR_DUPLICATE_ID,
     ):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_invalid_duplicate_execution_operations():
+def test_validate_invalid_duplicate_execution_operations(execution_raw):
     """Test validation fails with duplicate EXECUTION operations."""
-    execution = _create_test_execution()
-
     # EXECUTION operations cannot have duplicate updates in same batch
     # (though this is also caught by _validate_conflicting_execution_update)
-    updates = [
-        OperationUpdate(
-            operation_id="exec-1",
-            operation_type=OperationType.EXECUTION,
-            action=OperationAction.SUCCEED,
-        ),
-        OperationUpdate(
-            operation_id="exec-1",
-            operation_type=OperationType.EXECUTION,
-            action=OperationAction.SUCCEED,
-        ),
-    ]
+    updates = [_EXEC_SUCCEED, _EXEC_SUCCEED]
 
     with pytest.raises(InvalidParameterValueException):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_duplicate_context_start_then_succeed():
+def test_validate_duplicate_context_start_then_succeed(execution_raw):
     """Test validation allows CONTEXT START followed by SUCCEED."""
-    execution = _create_test_execution()
-
     # CONTEXT operations can have START + non-START in same batch
-    updates = [
-        OperationUpdate(
-            operation_id="context-1",
-            operation_type=OperationType.CONTEXT,
-            action=OperationAction.START,
-        ),
-        OperationUpdate(
-            operation_id="context-1",
-            operation_type=OperationType.CONTEXT,
-            action=OperationAction.SUCCEED,
-        ),
-    ]
+    updates = [_CONTEXT_START, _CONTEXT_SUCCEED]
 
     # Should not raise
-    CheckpointValidator.validate_input(updates, execution)
+    CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_invalid_duplicate_context_non_start():
+def test_validate_invalid_duplicate_context_non_start(execution_raw):
     """Test validation fails with duplicate CONTEXT non-START operations."""
-    execution = _create_test_execution()
-
     # CONTEXT operations cannot have duplicate non-START updates
-    updates = [
-        OperationUpdate(
-            operation_id="context-1",
-            operation_type=OperationType.CONTEXT,
-            action=OperationAction.SUCCEED,
-        ),
-        OperationUpdate(
-            operation_id="context-1",
-            operation_type=OperationType.CONTEXT,
-            action=OperationAction.SUCCEED,
-        ),
-    ]
+    updates = [_CONTEXT_SUCCEED, _CONTEXT_SUCCEED]
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot checkpoint multiple operations with the same ID",
+        match=_ERR_DUPLICATE_ID,
     ):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
 
 
-def test_validate_invalid_duplicate_step_non_start():
+def test_validate_invalid_duplicate_step_non_start(execution_raw):
     """Test validation fails with duplicate STEP non-START operations."""
-    execution = _create_test_execution()
-
     # STEP operations cannot have duplicate non-START updates
-    updates = [
-        OperationUpdate(
-            operation_id="step-1",
-            operation_type=OperationType.STEP,
-            action=OperationAction.SUCCEED,
-        ),
-        OperationUpdate(
-            operation_id="step-1",
-            operation_type=OperationType.STEP,
-            action=OperationAction.SUCCEED,
-        ),
-    ]
+    updates = [_STEP_SUCCEED, _STEP_SUCCEED]
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot checkpoint multiple operations with the same ID",
+        match=_ERR_DUPLICATE_ID,
     ):
-        CheckpointValidator.validate_input(updates, execution)
+        CheckpointValidator.validate_input(updates, execution_raw)
@@ -1,5 +1,7 @@
 """Unit tests for callback operation validator."""
 
+import re
+
 import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
     Operation,
@@ -17,14 +19,24 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 )
 
 
+_ERR_ALREADY_EXISTS = re.compile(r"Cannot start a CALLBACK that already exist")
+_ERR_INVALID_CALLBACK = re.compile(r"Invalid action for CALLBACK operation.")
+
+_CALLBACK_START = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.CALLBACK,
+    action=OperationAction.START,
+)
+_CALLBACK_CANCEL = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.CALLBACK,
+    action=OperationAction.CANCEL,
+)
+
+
 def test_validate_start_action_with_no_current_state():
     """Test START action with no current state."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CALLBACK,
-        action=OperationAction.START,
-    )
-    CallbackOperationValidator.validate(None, update)
+    CallbackOperationValidator.validate(None, _CALLBACK_START)
 
 
 def test_validate_start_action_with_existing_state():
@@ -34,32 +46,21 @@ def test_validate_start_action_with_existing_state():
         operation_type=OperationType.CALLBACK,
         status=OperationStatus.STARTED,
     )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CALLBACK,
-        action=OperationAction.START,
-    )
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot start a CALLBACK that already exist",
+        match=_ERR_ALREADY_EXISTS,
     ):
-        CallbackOperationValidator.validate(current_state, update)
+        CallbackOperationValidator.validate(current_state, _CALLBACK_START)
 
 
 def test_validate_cancel_action_with_no_current_state():
     """Test CANCEL action with no current state raises error."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CALLBACK,
-        action=OperationAction.CANCEL,
-    )
-
     with pytest.raises(
         InvalidParameterValueException,
-        match="Invalid action for CALLBACK operation.",
+        match=_ERR_INVALID_CALLBACK,
     ):
-        CallbackOperationValidator.validate(None, update)
+        CallbackOperationValidator.validate(None, _CALLBACK_CANCEL)
 
 
 def test_validate_cancel_action_with_completed_state():
@@ -69,17 +70,12 @@ def test_validate_cancel_action_with_completed_state():
         operation_type=OperationType.CALLBACK,
         status=OperationStatus.SUCCEEDED,
     )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CALLBACK,
-        action=OperationAction.CANCEL,
-    )
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Invalid action for CALLBACK operation.",
+        match=_ERR_INVALID_CALLBACK,
     ):
-        CallbackOperationValidator.validate(current_state, update)
+        CallbackOperationValidator.validate(current_state, _CALLBACK_CANCEL)
 
 
 def test_validate_invalid_action():
@@ -90,7 +86,5 @@ def test_validate_invalid_action():
         action=OperationAction.SUCCEED,
     )
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Invalid action for CALLBACK operation."
-    ):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_INVALID_CALLBACK):
         CallbackOperationValidator.validate(None, update)
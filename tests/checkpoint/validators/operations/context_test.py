@@ -1,5 +1,7 @@
 """Tests for context operation validator."""
 
+import re
+
 import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
     ErrorObject,
@@ -19,6 +21,48 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 )
 
 
+_ERR_ALREADY_EXISTS = re.compile(r"Cannot start a CONTEXT that already exist.")
+_ERR_INVALID_CLOSE_STATE = re.compile(r"Invalid current CONTEXT state to close.")
+_ERR_PAYLOAD_ON_FAIL = re.compile(r"Cannot provide a Payload for FAIL action.")
+_ERR_ERROR_ON_SUCCEED = re.compile(r"Cannot provide an Error for SUCCEED action.")
+_ERR_INVALID_CONTEXT_ACTION = re.compile(r"Invalid CONTEXT action.")
+
+_TEST_ERROR = ErrorObject(
+    message="test error", type="TestError", data=None, stack_trace=None
+)
+_STARTED_STATE = Operation(
+    operation_id="test-id",
+    operation_type=OperationType.CONTEXT,
+    status=OperationStatus.STARTED,
+)
+_CONTEXT_START = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.CONTEXT,
+    action=OperationAction.START,
+)
+_CONTEXT_SUCCEED = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.CONTEXT,
+    action=OperationAction.SUCCEED,
+    payload="success_payload",
+)
+_CONTEXT_FAIL = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.CONTEXT,
+    action=OperationAction.FAIL,
+    error=_TEST_ERROR,
+)
+_INVALID_CLOSE_STATUSES = (
+    OperationStatus.PENDING,
+    OperationStatus.READY,
+    OperationStatus.SUCCEEDED,
+    OperationStatus.FAILED,
+    OperationStatus.CANCELLED,
+    OperationStatus.TIMED_OUT,
+    OperationStatus.STOPPED,
+)
+
+
 def test_valid_actions_for_context():
     """Test that VALID_ACTIONS_FOR_CONTEXT contains expected actions."""
     expected_actions = {
@@ -31,150 +75,65 @@ def test_valid_actions_for_context():
 
 def test_validate_start_action_with_no_current_state():
     """Test START action validation when no current state exists."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        action=OperationAction.START,
-    )
-
     # Should not raise exception
-    ContextOperationValidator.validate(None, update)
+    ContextOperationValidator.validate(None, _CONTEXT_START)
 
 
 def test_validate_start_action_with_existing_state():
     """Test START action validation when current state already exists."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        action=OperationAction.START,
-    )
-
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot start a CONTEXT that already exist.",
+        match=_ERR_ALREADY_EXISTS,
     ):
-        ContextOperationValidator.validate(current_state, update)
+        ContextOperationValidator.validate(_STARTED_STATE, _CONTEXT_START)
 
 
 def test_validate_succeed_action_with_started_state():
     """Test SUCCEED action validation with STARTED state."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        action=OperationAction.SUCCEED,
-        payload="success_payload",
-    )
-
     # Should not raise exception
-    ContextOperationValidator.validate(current_state, update)
+    ContextOperationValidator.validate(_STARTED_STATE, _CONTEXT_SUCCEED)
 
 
 def test_validate_fail_action_with_started_state():
     """Test FAIL action validation with STARTED state."""
+    # Should not raise exception
+    ContextOperationValidator.validate(_STARTED_STATE, _CONTEXT_FAIL)
+
+
+@pytest.mark.parametrize("status", _INVALID_CLOSE_STATUSES)
+def test_validate_succeed_action_with_invalid_status(status):
+    """Test SUCCEED action validation with invalid status."""
     current_state = Operation(
         operation_id="test-id",
         operation_type=OperationType.CONTEXT,
-        status=OperationStatus.STARTED,
-    )
-    error = ErrorObject(
-        message="test error", type="TestError", data=None, stack_trace=None
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        action=OperationAction.FAIL,
-        error=error,
+        status=status,
     )
 
-    # Should not raise exception
-    ContextOperationValidator.validate(current_state, update)
+    with pytest.raises(
+        InvalidParameterValueException,
+        match=_ERR_INVALID_CLOSE_STATE,
+    ):
+        ContextOperationValidator.validate(current_state, _CONTEXT_SUCCEED)
 
 
-def test_validate_succeed_action_with_invalid_status():
-    """Test SUCCEED action validation with invalid status."""
-    invalid_statuses = [
-        OperationStatus.PENDING,
-        OperationStatus.READY,
-        OperationStatus.SUCCEEDED,
-        OperationStatus.FAILED,
-        OperationStatus.CANCELLED,
-        OperationStatus.TIMED_OUT,
-        OperationStatus.STOPPED,
-    ]
-
-    for status in invalid_statuses:
-        current_state = Operation(
-            operation_id="test-id",
-            operation_type=OperationType.CONTEXT,
-            status=status,
-        )
-        update = OperationUpdate(
-            operation_id="test-id",
-            operation_type=OperationType.CONTEXT,
-            action=OperationAction.SUCCEED,
-            payload="success_payload",
-        )
-
-        with pytest.raises(
-            InvalidParameterValueException,
-            match="Invalid current CONTEXT state to close.",
-        ):
-            ContextOperationValidator.validate(current_state, update)
-
-
-def test_validate_fail_action_with_invalid_status():
+@pytest.mark.parametrize("status", _INVALID_CLOSE_STATUSES)
+def test_validate_fail_action_with_invalid_status(status):
     """Test FAIL action validation with invalid status."""
-    invalid_statuses = [
-        OperationStatus.PENDING,
-        OperationStatus.READY,
-        OperationStatus.SUCCEEDED,
-        OperationStatus.FAILED,
-        OperationStatus.CANCELLED,
-        OperationStatus.TIMED_OUT,
-        OperationStatus.STOPPED,
-    ]
-
-    error = ErrorObject(
-        message="test error", type="TestError", data=None, stack_trace=None
+    current_state = Operation(
+        operation_id="test-id",
+        operation_type=OperationType.CONTEXT,
+        status=status,
     )
 
-    for status in invalid_statuses:
-        current_state = Operation(
-            operation_id="test-id",
-            operation_type=OperationType.CONTEXT,
-            status=status,
-        )
-        update = OperationUpdate(
-            operation_id="test-id",
-            operation_type=OperationType.CONTEXT,
-            action=OperationAction.FAIL,
-            error=error,
-        )
-
-        with pytest.raises(
-            InvalidParameterValueException,
-            match="Invalid current CONTEXT state to close.",
-        ):
-            ContextOperationValidator.validate(current_state, update)
+    with pytest.raises(
+        InvalidParameterValueException,
+        match=_ERR_INVALID_CLOSE_STATE,
+    ):
+        ContextOperationValidator.validate(current_state, _CONTEXT_FAIL)
 
 
 def test_validate_fail_action_with_payload():
     """Test FAIL action validation when payload is provided."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        status=OperationStatus.STARTED,
-    )
     update = OperationUpdate(
         operation_id="test-id",
         operation_type=OperationType.CONTEXT,
@@ -184,74 +143,46 @@ def test_validate_fail_action_with_payload():
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot provide a Payload for FAIL action.",
+        match=_ERR_PAYLOAD_ON_FAIL,
     ):
-        ContextOperationValidator.validate(current_state, update)
+        ContextOperationValidator.validate(_STARTED_STATE, update)
 
 
 def test_validate_succeed_action_with_error():
     """Test SUCCEED action validation when error is provided."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        status=OperationStatus.STARTED,
-    )
-    error = ErrorObject(
-        message="test error", type="TestError", data=None, stack_trace=None
-    )
     update = OperationUpdate(
         operation_id="test-id",
         operation_type=OperationType.CONTEXT,
         action=OperationAction.SUCCEED,
-        error=error,
+        error=_TEST_ERROR,
     )
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot provide an Error for SUCCEED action.",
+        match=_ERR_ERROR_ON_SUCCEED,
     ):
-        ContextOperationValidator.validate(current_state, update)
+        ContextOperationValidator.validate(_STARTED_STATE, update)
 
 
 def test_validate_close_actions_with_no_current_state():
     """Test SUCCEED and FAIL actions validation when no current state exists."""
     # SUCCEED with no current state should pass
-    succeed_update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CONTEXT,
-        action=OperationAction.SUCCEED,
-        payload="success_payload",
-    )
-    ContextOperationValidator.validate(None, succeed_update)
+    ContextOperationValidator.validate(None, _CONTEXT_SUCCEED)
 
     # FAIL with no current state should pass
-    error = ErrorObject(
-        message="test error", type="TestError", data=None, stack_trace=None
-    )
-    fail_update = OperationUpdate(
+    ContextOperationValidator.validate(None, _CONTEXT_FAIL)
+
+
+@pytest.mark.parametrize("action", [OperationAction.RETRY, OperationAction.CANCEL])
+def test_validate_invalid_action(action):
+    """Test validation with invalid action."""
+    update = OperationUpdate(
         operation_id="test-id",
         operation_type=OperationType.CONTEXT,
-        action=OperationAction.FAIL,
-        error=error,
+        action=action,
     )
-    ContextOperationValidator.validate(None, fail_update)
 
-
-def test_validate_invalid_action():
-    """Test validation with invalid action."""
-    invalid_actions = [
-        OperationAction.RETRY,
-        OperationAction.CANCEL,
-    ]
-
-    for action in invalid_actions:
-        update = OperationUpdate(
-            operation_id="test-id",
-            operation_type=OperationType.CONTEXT,
-            action=action,
-        )
-
-        with pytest.raises(
-            InvalidParameterValueException, match="Invalid CONTEXT action."
-        ):
-            ContextOperationValidator.validate(None, update)
+    with pytest.raises(
+        InvalidParameterValueException, match=_ERR_INVALID_CONTEXT_ACTION
+    ):
+        ContextOperationValidator.validate(None, update)
@@ -1,5 +1,7 @@
 """Unit tests for execution operation validator."""
 
+import re
+
 import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
     ErrorObject,
@@ -16,6 +18,15 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 )
 
 
+_ERR_ERROR_ON_SUCCEED = re.compile(r"Cannot provide an Error for SUCCEED action")
+_ERR_PAYLOAD_ON_FAIL = re.compile(r"Cannot provide a Payload for FAIL action")
+_ERR_INVALID_EXECUTION_ACTION = re.compile(r"Invalid EXECUTION action")
+
+_TEST_ERROR = ErrorObject(
+    message="Test error", type="TestError", data=None, stack_trace=None
+)
+
+
 def test_validate_succeed_action():
     """Test SUCCEED action validation."""
     update = OperationUpdate(
@@ -33,9 +44,7 @@ def test_validate_fail_action():
         operation_id="test-id",
         operation_type=OperationType.EXECUTION,
         action=OperationAction.FAIL,
-        error=ErrorObject(
-            message="Test error", type="TestError", data=None, stack_trace=None
-        ),
+        error=_TEST_ERROR,
     )
     ExecutionOperationValidator.validate(update)
 
@@ -46,14 +55,12 @@ def test_validate_succeed_action_with_error():
         operation_id="test-id",
         operation_type=OperationType.EXECUTION,
         action=OperationAction.SUCCEED,
-        error=ErrorObject(
-            message="Test error", type="TestError", data=None, stack_trace=None
-        ),
+        error=_TEST_ERROR,
     )
 
     with pytest.raises(
         InvalidParameterValueException,
-        match="Cannot provide an Error for SUCCEED action",
+        match=_ERR_ERROR_ON_SUCCEED,
     ):
         ExecutionOperationValidator.validate(update)
 
@@ -67,9 +74,7 @@ def test_validate_fail_action_with_payload():
         payload="invalid",
     )
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Cannot provide a Payload for FAIL action"
-    ):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_PAYLOAD_ON_FAIL):
         ExecutionOperationValidator.validate(update)
 
 
@@ -82,7 +87,7 @@ def test_validate_invalid_action():
     )
 
     with pytest.raises(
-        InvalidParameterValueException, match="Invalid EXECUTION action"
+        InvalidParameterValueException, match=_ERR_INVALID_EXECUTION_ACTION
     ):
         ExecutionOperationValidator.validate(update)
 
@@ -1,5 +1,7 @@
 """Unit tests for invoke operation validator."""
 
+import re
+
 import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
     Operation,
@@ -17,93 +19,74 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 )
 
 
-def test_validate_start_action_with_no_current_state():
-    """Test START action with no current state."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        action=OperationAction.START,
-    )
-    ChainedInvokeOperationValidator.validate(None, update)
-
-
-def test_validate_start_action_with_existing_state():
-    """Test START action with existing state raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        action=OperationAction.START,
-    )
+_ERR_ALREADY_EXISTS = re.compile(r"Cannot start an INVOKE that already exist")
+_ERR_CANNOT_CANCEL = re.compile(
+    r"Cannot cancel an INVOKE that does not exist or has already completed"
+)
+_ERR_INVALID_ACTION = re.compile(r"Invalid INVOKE action")
 
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Cannot start an INVOKE that already exist",
-    ):
-        ChainedInvokeOperationValidator.validate(current_state, update)
+_INVOKE_START = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.CHAINED_INVOKE,
+    action=OperationAction.START,
+)
+_INVOKE_CANCEL = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.CHAINED_INVOKE,
+    action=OperationAction.CANCEL,
+)
+_INVOKE_SUCCEED = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.CHAINED_INVOKE,
+    action=OperationAction.SUCCEED,
+)
+_STARTED_STATE = Operation(
+    operation_id="test-id",
+    operation_type=OperationType.CHAINED_INVOKE,
+    status=OperationStatus.STARTED,
+)
+_SUCCEEDED_STATE = Operation(
+    operation_id="test-id",
+    operation_type=OperationType.CHAINED_INVOKE,
+    status=OperationStatus.SUCCEEDED,
+)
 
 
-def test_validate_cancel_action_with_started_state():
-    """Test CANCEL action with STARTED state."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        action=OperationAction.CANCEL,
-    )
+_VALID_CASES = [
+    pytest.param(None, _INVOKE_START, id="start_action_with_no_current_state"),
+    pytest.param(_STARTED_STATE, _INVOKE_CANCEL, id="cancel_action_with_started_state"),
+]
+_INVALID_CASES = [
+    pytest.param(
+        _STARTED_STATE,
+        _INVOKE_START,
+        _ERR_ALREADY_EXISTS,
+        id="start_action_with_existing_state",
+    ),
+    pytest.param(
+        None,
+        _INVOKE_CANCEL,
+        _ERR_CANNOT_CANCEL,
+        id="cancel_action_with_no_current_state",
+    ),
+    pytest.param(
+        _SUCCEEDED_STATE,
+        _INVOKE_CANCEL,
+        _ERR_CANNOT_CANCEL,
+        id="cancel_action_with_completed_state",
+    ),
+    pytest.param(None, _INVOKE_SUCCEED, _ERR_INVALID_ACTION, id="invalid_action"),
+]
+
+
+@pytest.mark.parametrize(("current_state", "update"), _VALID_CASES)
+def test_validate_valid_updates(current_state, update):
+    """Test INVOKE updates that are accepted for the current state."""
     ChainedInvokeOperationValidator.validate(current_state, update)
 
 
-def test_validate_cancel_action_with_no_current_state():
-    """Test CANCEL action with no current state raises error."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        action=OperationAction.CANCEL,
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Cannot cancel an INVOKE that does not exist or has already completed",
-    ):
-        ChainedInvokeOperationValidator.validate(None, update)
-
-
-def test_validate_cancel_action_with_completed_state():
-    """Test CANCEL action with completed state raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        status=OperationStatus.SUCCEEDED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        action=OperationAction.CANCEL,
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Cannot cancel an INVOKE that does not exist or has already completed",
-    ):
+@pytest.mark.parametrize(("current_state", "update", "expected_match"), _INVALID_CASES)
+def test_validate_invalid_updates(current_state, update, expected_match):
+    """Test INVOKE updates that are rejected for the current state."""
+    with pytest.raises(InvalidParameterValueException, match=expected_match):
         ChainedInvokeOperationValidator.validate(current_state, update)
-
-
-def test_validate_invalid_action():
-    """Test invalid action raises error."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.CHAINED_INVOKE,
-        action=OperationAction.SUCCEED,
-    )
-
-    with pytest.raises(InvalidParameterValueException, match="Invalid INVOKE action"):
-        ChainedInvokeOperationValidator.validate(None, update)
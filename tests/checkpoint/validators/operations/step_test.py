@@ -1,5 +1,7 @@
 """Unit tests for step operation validator."""
 
+import re
+
 import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
     ErrorObject,
@@ -19,254 +21,164 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 )
 
 
-def test_validate_with_no_current_state():
-    """Test validation with no current state."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.START,
-    )
-    StepOperationValidator.validate(None, update)
-
-
-def test_validate_start_action_with_ready_state():
-    """Test START action with READY state."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.READY,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.START,
-    )
-    StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_start_action_with_invalid_state():
-    """Test START action with invalid state raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.SUCCEEDED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.START,
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException, match="Invalid current STEP state to start"
-    ):
-        StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_succeed_action_with_started_state():
-    """Test SUCCEED action with STARTED state."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.SUCCEED,
-        payload={"result": "success"},
-    )
-    StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_fail_action_with_ready_state():
-    """Test FAIL action with READY state."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.READY,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.FAIL,
-        error=ErrorObject(
-            message="Test error", type="TestError", data=None, stack_trace=None
-        ),
-    )
-    StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_fail_action_with_invalid_state():
-    """Test FAIL action with invalid state raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.SUCCEEDED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.FAIL,
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException, match="Invalid current STEP state to close"
-    ):
-        StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_fail_action_with_payload():
-    """Test FAIL action with payload raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.FAIL,
-        payload={"invalid": "payload"},
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException, match="Cannot provide a Payload for FAIL action"
-    ):
-        StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_succeed_action_with_error():
-    """Test SUCCEED action with error raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.SUCCEED,
-        error=ErrorObject(
-            message="Test error", type="TestError", data=None, stack_trace=None
-        ),
-    )
+_ERR_INVALID_START_STATE = re.compile(r"Invalid current STEP state to start")
+_ERR_INVALID_CLOSE_STATE = re.compile(r"Invalid current STEP state to close")
+_ERR_FAIL_WITH_PAYLOAD = re.compile(r"Cannot provide a Payload for FAIL action")
+_ERR_SUCCEED_WITH_ERROR = re.compile(r"Cannot provide an Error for SUCCEED action")
+_ERR_INVALID_RETRY_STATE = re.compile(r"Invalid current STEP state to re-attempt")
+_ERR_INVALID_STEP_OPTIONS = re.compile(r"Invalid StepOptions for the given action")
+_ERR_RETRY_WITH_ERROR_AND_PAYLOAD = re.compile(
+    r"Cannot provide both error and payload to RETRY a STEP"
+)
+_ERR_INVALID_ACTION = re.compile(r"Invalid STEP action")
 
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Cannot provide an Error for SUCCEED action",
-    ):
-        StepOperationValidator.validate(current_state, update)
+_TEST_ERROR = ErrorObject(
+    message="Test error", type="TestError", data=None, stack_trace=None
+)
+_TEST_PAYLOAD = {"result": "success"}
+_TEST_STEP_OPTIONS = StepOptions(next_attempt_delay_seconds=3)
 
+_READY_STATE = Operation(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    status=OperationStatus.READY,
+)
+_STARTED_STATE = Operation(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    status=OperationStatus.STARTED,
+)
+_SUCCEEDED_STATE = Operation(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    status=OperationStatus.SUCCEEDED,
+)
 
-def test_validate_retry_action_with_started_state():
-    """Test RETRY action with STARTED state."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.RETRY,
-        step_options=StepOptions(next_attempt_delay_seconds=3),
-    )
-    StepOperationValidator.validate(current_state, update)
+_STEP_START = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.START,
+)
+_STEP_SUCCEED = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.SUCCEED,
+    payload=_TEST_PAYLOAD,
+)
+_STEP_SUCCEED_WITH_ERROR = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.SUCCEED,
+    error=_TEST_ERROR,
+)
+_STEP_FAIL = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.FAIL,
+    error=_TEST_ERROR,
+)
+_STEP_FAIL_WITHOUT_ERROR = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.FAIL,
+)
+_STEP_FAIL_WITH_PAYLOAD = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.FAIL,
+    payload={"invalid": "payload"},
+)
+_STEP_RETRY = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.RETRY,
+    step_options=_TEST_STEP_OPTIONS,
+)
+_STEP_RETRY_WITHOUT_OPTIONS = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.RETRY,
+)
+_STEP_RETRY_WITH_ERROR_AND_PAYLOAD = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.RETRY,
+    step_options=_TEST_STEP_OPTIONS,
+    error=_TEST_ERROR,
+    payload=_TEST_PAYLOAD,
+)
+_STEP_CANCEL = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.STEP,
+    action=OperationAction.CANCEL,
+)
 
 
-def test_validate_retry_action_with_ready_state():
-    """Test RETRY action with READY state."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.READY,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.RETRY,
-        step_options=StepOptions(next_attempt_delay_seconds=3),
-    )
+_VALID_CASES = [
+    pytest.param(None, _STEP_START, id="with_no_current_state"),
+    pytest.param(_READY_STATE, _STEP_START, id="start_action_with_ready_state"),
+    pytest.param(_STARTED_STATE, _STEP_SUCCEED, id="succeed_action_with_started_state"),
+    pytest.param(_READY_STATE, _STEP_FAIL, id="fail_action_with_ready_state"),
+    pytest.param(_STARTED_STATE, _STEP_RETRY, id="retry_action_with_started_state"),
+    pytest.param(_READY_STATE, _STEP_RETRY, id="retry_action_with_ready_state"),
+]
+_INVALID_CASES = [
+    pytest.param(
+        _SUCCEEDED_STATE,
+        _STEP_START,
+        _ERR_INVALID_START_STATE,
+        id="start_action_with_invalid_state",
+    ),
+    pytest.param(
+        _SUCCEEDED_STATE,
+        _STEP_FAIL_WITHOUT_ERROR,
+        _ERR_INVALID_CLOSE_STATE,
+        id="fail_action_with_invalid_state",
+    ),
+    pytest.param(
+        _STARTED_STATE,
+        _STEP_FAIL_WITH_PAYLOAD,
+        _ERR_FAIL_WITH_PAYLOAD,
+        id="fail_action_with_payload",
+    ),
+    pytest.param(
+        _STARTED_STATE,
+        _STEP_SUCCEED_WITH_ERROR,
+        _ERR_SUCCEED_WITH_ERROR,
+        id="succeed_action_with_error",
+    ),
+    pytest.param(
+        _SUCCEEDED_STATE,
+        _STEP_RETRY,
+        _ERR_INVALID_RETRY_STATE,
+        id="retry_action_with_invalid_state",
+    ),
+    pytest.param(
+        _STARTED_STATE,
+        _STEP_RETRY_WITHOUT_OPTIONS,
+        _ERR_INVALID_STEP_OPTIONS,
+        id="retry_action_without_step_options",
+    ),
+    pytest.param(
+        _STARTED_STATE,
+        _STEP_RETRY_WITH_ERROR_AND_PAYLOAD,
+        _ERR_RETRY_WITH_ERROR_AND_PAYLOAD,
+        id="retry_action_with_both_error_and_payload",
+    ),
+    pytest.param(
+        _STARTED_STATE, _STEP_CANCEL, _ERR_INVALID_ACTION, id="invalid_action"
+    ),
+]
+
+
+@pytest.mark.parametrize(("current_state", "update"), _VALID_CASES)
+def test_validate_valid_updates(current_state, update):
+    """Test STEP updates that are accepted for the current state."""
     StepOperationValidator.validate(current_state, update)
 
 
-def test_validate_retry_action_with_invalid_state():
-    """Test RETRY action with invalid state raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.SUCCEEDED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.RETRY,
-        step_options=StepOptions(next_attempt_delay_seconds=3),
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException, match="Invalid current STEP state to re-attempt"
-    ):
-        StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_retry_action_without_step_options():
-    """Test RETRY action without step options raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.RETRY,
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException, match="Invalid StepOptions for the given action"
-    ):
-        StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_retry_action_with_both_error_and_payload():
-    """Test RETRY action with both error and payload raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.RETRY,
-        step_options=StepOptions(next_attempt_delay_seconds=3),
-        error=ErrorObject(
-            message="Test error", type="TestError", data=None, stack_trace=None
-        ),
-        payload={"result": "success"},
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Cannot provide both error and payload to RETRY a STEP",
-    ):
-        StepOperationValidator.validate(current_state, update)
-
-
-def test_validate_invalid_action():
-    """Test invalid action raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.STEP,
-        action=OperationAction.CANCEL,
-    )
-
-    with pytest.raises(InvalidParameterValueException, match="Invalid STEP action"):
+@pytest.mark.parametrize(("current_state", "update", "expected_match"), _INVALID_CASES)
+def test_validate_invalid_updates(current_state, update, expected_match):
+    """Test STEP updates that are rejected for the current state."""
+    with pytest.raises(InvalidParameterValueException, match=expected_match):
         StepOperationValidator.validate(current_state, update)
@@ -1,5 +1,7 @@
 """Unit tests for wait operation validator."""
 
+import re
+
 import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
     Operation,
@@ -17,92 +19,71 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 )
 
 
-def test_validate_start_action_with_no_current_state():
-    """Test START action with no current state."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        action=OperationAction.START,
-    )
-    WaitOperationValidator.validate(None, update)
-
-
-def test_validate_start_action_with_existing_state():
-    """Test START action with existing state raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        action=OperationAction.START,
-    )
+_ERR_ALREADY_EXISTS = re.compile(r"Cannot start a WAIT that already exist")
+_ERR_CANNOT_CANCEL = re.compile(
+    r"Cannot cancel a WAIT that does not exist or has already completed"
+)
+_ERR_INVALID_ACTION = re.compile(r"Invalid WAIT action")
 
-    with pytest.raises(
-        InvalidParameterValueException, match="Cannot start a WAIT that already exist"
-    ):
-        WaitOperationValidator.validate(current_state, update)
+_WAIT_START = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.WAIT,
+    action=OperationAction.START,
+)
+_WAIT_CANCEL = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.WAIT,
+    action=OperationAction.CANCEL,
+)
+_WAIT_SUCCEED = OperationUpdate(
+    operation_id="test-id",
+    operation_type=OperationType.WAIT,
+    action=OperationAction.SUCCEED,
+)
+_STARTED_STATE = Operation(
+    operation_id="test-id",
+    operation_type=OperationType.WAIT,
+    status=OperationStatus.STARTED,
+)
+_SUCCEEDED_STATE = Operation(
+    operation_id="test-id",
+    operation_type=OperationType.WAIT,
+    status=OperationStatus.SUCCEEDED,
+)
 
 
-def test_validate_cancel_action_with_started_state():
-    """Test CANCEL action with STARTED state."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        status=OperationStatus.STARTED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        action=OperationAction.CANCEL,
-    )
+_VALID_CASES = [
+    pytest.param(None, _WAIT_START, id="start_action_with_no_current_state"),
+    pytest.param(_STARTED_STATE, _WAIT_CANCEL, id="cancel_action_with_started_state"),
+]
+_INVALID_CASES = [
+    pytest.param(
+        _STARTED_STATE,
+        _WAIT_START,
+        _ERR_ALREADY_EXISTS,
+        id="start_action_with_existing_state",
+    ),
+    pytest.param(
+        None, _WAIT_CANCEL, _ERR_CANNOT_CANCEL, id="cancel_action_with_no_current_state"
+    ),
+    pytest.param(
+        _SUCCEEDED_STATE,
+        _WAIT_CANCEL,
+        _ERR_CANNOT_CANCEL,
+        id="cancel_action_with_completed_state",
+    ),
+    pytest.param(None, _WAIT_SUCCEED, _ERR_INVALID_ACTION, id="invalid_action"),
+]
+
+
+@pytest.mark.parametrize(("current_state", "update"), _VALID_CASES)
+def test_validate_valid_updates(current_state, update):
+    """Test WAIT updates that are accepted for the current state."""
     WaitOperationValidator.validate(current_state, update)
 
 
-def test_validate_cancel_action_with_no_current_state():
-    """Test CANCEL action with no current state raises error."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        action=OperationAction.CANCEL,
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Cannot cancel a WAIT that does not exist or has already completed",
-    ):
-        WaitOperationValidator.validate(None, update)
-
-
-def test_validate_cancel_action_with_completed_state():
-    """Test CANCEL action with completed state raises error."""
-    current_state = Operation(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        status=OperationStatus.SUCCEEDED,
-    )
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        action=OperationAction.CANCEL,
-    )
-
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Cannot cancel a WAIT that does not exist or has already completed",
-    ):
+@pytest.mark.parametrize(("current_state", "update", "expected_match"), _INVALID_CASES)
+def test_validate_invalid_updates(current_state, update, expected_match):
+    """Test WAIT updates that are rejected for the current state."""
+    with pytest.raises(InvalidParameterValueException, match=expected_match):
         WaitOperationValidator.validate(current_state, update)
-
-
-def test_validate_invalid_action():
-    """Test invalid action raises error."""
-    update = OperationUpdate(
-        operation_id="test-id",
-        operation_type=OperationType.WAIT,
-        action=OperationAction.SUCCEED,
-    )
-
-    with pytest.raises(InvalidParameterValueException, match="Invalid WAIT action"):
-        WaitOperationValidator.validate(None, update)
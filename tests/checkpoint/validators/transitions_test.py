@@ -1,5 +1,7 @@
 """Unit tests for transitions validator."""
 
+import re
+
 import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
     OperationAction,
@@ -14,137 +16,58 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 )
 
 
-def test_validate_step_valid_actions():
-    """Test valid actions for STEP operations."""
-    valid_actions = [
-        OperationAction.START,
-        OperationAction.FAIL,
-        OperationAction.RETRY,
-        OperationAction.SUCCEED,
-    ]
-    for action in valid_actions:
-        ValidActionsByOperationTypeValidator.validate(OperationType.STEP, action)
-
-
-def test_validate_context_valid_actions():
-    """Test valid actions for CONTEXT operations."""
-    valid_actions = [
-        OperationAction.START,
-        OperationAction.FAIL,
-        OperationAction.SUCCEED,
-    ]
-    for action in valid_actions:
-        ValidActionsByOperationTypeValidator.validate(OperationType.CONTEXT, action)
-
-
-def test_validate_wait_valid_actions():
-    """Test valid actions for WAIT operations."""
-    valid_actions = [
-        OperationAction.START,
-        OperationAction.CANCEL,
-    ]
-    for action in valid_actions:
-        ValidActionsByOperationTypeValidator.validate(OperationType.WAIT, action)
-
-
-def test_validate_callback_valid_actions():
-    """Test valid actions for CALLBACK operations."""
-    valid_actions = [
-        OperationAction.START,
-    ]
-    for action in valid_actions:
-        ValidActionsByOperationTypeValidator.validate(OperationType.CALLBACK, action)
-
-
-def test_validate_invoke_valid_actions():
-    """Test valid actions for INVOKE operations."""
-    valid_actions = [
-        OperationAction.START,
-        OperationAction.CANCEL,
-    ]
-    for action in valid_actions:
-        ValidActionsByOperationTypeValidator.validate(
-            OperationType.CHAINED_INVOKE, action
-        )
-
-
-def test_validate_execution_valid_actions():
-    """Test valid actions for EXECUTION operations."""
-    valid_actions = [
-        OperationAction.SUCCEED,
-        OperationAction.FAIL,
-    ]
-    for action in valid_actions:
-        ValidActionsByOperationTypeValidator.validate(OperationType.EXECUTION, action)
-
-
-def test_validate_invalid_action_for_step():
-    """Test invalid action for STEP operation."""
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Invalid action for the given operation type",
-    ):
-        ValidActionsByOperationTypeValidator.validate(
-            OperationType.STEP, OperationAction.CANCEL
-        )
-
-
-def test_validate_invalid_action_for_context():
-    """Test invalid action for CONTEXT operation."""
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Invalid action for the given operation type",
-    ):
-        ValidActionsByOperationTypeValidator.validate(
-            OperationType.CONTEXT, OperationAction.RETRY
-        )
-
-
-def test_validate_invalid_action_for_wait():
-    """Test invalid action for WAIT operation."""
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Invalid action for the given operation type",
-    ):
-        ValidActionsByOperationTypeValidator.validate(
-            OperationType.WAIT, OperationAction.SUCCEED
-        )
-
-
-def test_validate_invalid_action_for_callback():
-    """Test invalid action for CALLBACK operation."""
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Invalid action for the given operation type",
-    ):
-        ValidActionsByOperationTypeValidator.validate(
-            OperationType.CALLBACK, OperationAction.FAIL
-        )
-
-
-def test_validate_invalid_action_for_invoke():
-    """Test invalid action for INVOKE operation."""
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Invalid action for the given operation type",
-    ):
-        ValidActionsByOperationTypeValidator.validate(
-            OperationType.CHAINED_INVOKE, OperationAction.RETRY
-        )
-
-
-def test_validate_invalid_action_for_execution():
-    """Test invalid action for EXECUTION operation."""
-    with pytest.raises(
-        InvalidParameterValueException,
-        match="Invalid action for the given operation type",
-    ):
-        ValidActionsByOperationTypeValidator.validate(
-            OperationType.EXECUTION, OperationAction.START
-        )
+_ERR_INVALID_ACTION = re.compile(r"Invalid action for the given operation type")
+_ERR_UNKNOWN_TYPE = re.compile(r"Unknown operation type")
+
+_VALID_ACTIONS: dict[OperationType, frozenset[OperationAction]] = {
+    OperationType.STEP: frozenset(
+        {
+            OperationAction.START,
+            OperationAction.FAIL,
+            OperationAction.RETRY,
+            OperationAction.SUCCEED,
+        }
+    ),
+    OperationType.CONTEXT: frozenset(
+        {OperationAction.START, OperationAction.FAIL, OperationAction.SUCCEED}
+    ),
+    OperationType.WAIT: frozenset({OperationAction.START, OperationAction.CANCEL}),
+    OperationType.CALLBACK: frozenset({OperationAction.START}),
+    OperationType.CHAINED_INVOKE: frozenset(
+        {OperationAction.START, OperationAction.CANCEL}
+    ),
+    OperationType.EXECUTION: frozenset({OperationAction.SUCCEED, OperationAction.FAIL}),
+}
+
+# iterate the enums rather than the sets so ids are stable across runs
+_VALID_CASES = [
+    pytest.param(op_type, action, id=f"{op_type.value}-{action.value}")
+    for op_type, actions in _VALID_ACTIONS.items()
+    for action in OperationAction
+    if action in actions
+]
+_INVALID_CASES = [
+    pytest.param(op_type, action, id=f"{op_type.value}-{action.value}")
+    for op_type, actions in _VALID_ACTIONS.items()
+    for action in OperationAction
+    if action not in actions
+]
+
+
+@pytest.mark.parametrize(("operation_type", "action"), _VALID_CASES)
+def test_validate_valid_actions(operation_type, action):
+    """Test every valid action is accepted for its operation type."""
+    ValidActionsByOperationTypeValidator.validate(operation_type, action)
+
+
+@pytest.mark.parametrize(("operation_type", "action"), _INVALID_CASES)
+def test_validate_invalid_actions(operation_type, action):
+    """Test every other action is rejected for the operation type."""
+    with pytest.raises(InvalidParameterValueException, match=_ERR_INVALID_ACTION):
+        ValidActionsByOperationTypeValidator.validate(operation_type, action)
 
 
 def test_validate_unknown_operation_type():
     """Test validation with unknown operation type."""
-    with pytest.raises(InvalidParameterValueException, match="Unknown operation type"):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_UNKNOWN_TYPE):
         ValidActionsByOperationTypeValidator.validate(None, OperationAction.START)
@@ -3,6 +3,7 @@
 import datetime
 from unittest.mock import Mock
 
+import pytest
 from aws_durable_execution_sdk_python.lambda_service import (
     CheckpointOutput,
     OperationAction,
@@ -14,17 +15,24 @@ from aws_durable_execution_sdk_python.lambda_service import (
 from aws_durable_execution_sdk_python_testing.client import InMemoryServiceClient
 
 
-def test_checkpoint():
+@pytest.fixture
+def processor():
+    return Mock()
+
+
+@pytest.fixture
+def client(processor):
+    return InMemoryServiceClient(processor)
+
+
+def test_checkpoint(processor, client):
     """Test checkpoint method delegates to processor."""
-    processor = Mock()
     expected_output = CheckpointOutput(
         checkpoint_token="new-token",  # noqa: S106
         new_execution_state=Mock(),
     )
     processor.process_checkpoint.return_value = expected_output
 
-    client = InMemoryServiceClient(processor)
-
     updates = [
         OperationUpdate(
             operation_id="test-id",
@@ -46,14 +54,11 @@ def test_checkpoint():
     )
 
 
-def test_get_execution_state():
+def test_get_execution_state(processor, client):
     """Test get_execution_state method delegates to processor."""
-    processor = Mock()
     expected_output = StateOutput(operations=[], next_marker="marker")
     processor.get_execution_state.return_value = expected_output
 
-    client = InMemoryServiceClient(processor)
-
     result = client.get_execution_state(
         "arn:aws:lambda:us-east-1:123456789012:function:test", "token", "marker", 500
     )
@@ -62,14 +67,11 @@ def test_get_execution_state():
     processor.get_execution_state.assert_called_once_with("token", "marker", 500)
 
 
-def test_get_execution_state_default_max_items():
+def test_get_execution_state_default_max_items(processor, client):
     """Test get_execution_state with default max_items."""
-    processor = Mock()
     expected_output = StateOutput(operations=[], next_marker="marker")
     processor.get_execution_state.return_value = expected_output
 
-    client = InMemoryServiceClient(processor)
-
     result = client.get_execution_state(
         "arn:aws:lambda:us-east-1:123456789012:function:test", "token", "marker"
     )
@@ -78,26 +80,17 @@ def test_get_execution_state_default_max_items():
     processor.get_execution_state.assert_called_once_with("token", "marker", 1000)
 
 
-def test_stop():
+@pytest.mark.parametrize(
+    "payload",
+    [pytest.param(b"payload", id="with_payload"), pytest.param(None, id="no_payload")],
+)
+def test_stop(client, payload):
     """Test stop method returns current datetime."""
-    processor = Mock()
-    client = InMemoryServiceClient(processor)
-
     before = datetime.datetime.now(tz=datetime.UTC)
     result = client.stop(
-        "arn:aws:states:us-east-1:123456789012:execution:test", b"payload"
+        "arn:aws:states:us-east-1:123456789012:execution:test", payload
     )
     after = datetime.datetime.now(tz=datetime.UTC)
 
     assert isinstance(result, datetime.datetime)
     assert before <= result <= after
-
-
-def test_stop_with_none_payload():
-    """Test stop method with None payload."""
-    processor = Mock()
-    client = InMemoryServiceClient(processor)
-
-    result = client.stop("arn:aws:states:us-east-1:123456789012:execution:test", None)
-
-    assert isinstance(result, datetime.datetime)
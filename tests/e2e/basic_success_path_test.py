@@ -3,6 +3,8 @@
 import json
 from typing import Any
 
+import pytest
+from aws_durable_execution_sdk_python.config import Duration
 from aws_durable_execution_sdk_python.context import (
     DurableContext,
     durable_step,
@@ -14,17 +16,27 @@ from aws_durable_execution_sdk_python.execution import (
 )
 from aws_durable_execution_sdk_python.types import StepContext
 
+from aws_durable_execution_sdk_python_testing.executor import Executor
 from aws_durable_execution_sdk_python_testing.runner import (
     ContextOperation,
     DurableFunctionTestResult,
     DurableFunctionTestRunner,
     StepOperation,
 )
-from aws_durable_execution_sdk_python.config import Duration
 
 
 # brazil-test-exec pytest test/runner_int_test.py
-def test_basic_durable_function() -> None:
+def test_basic_durable_function(monkeypatch: pytest.MonkeyPatch) -> None:
+    # fire wait timers straight away: the test checks ordering, not wall-clock time
+    on_wait_timer_scheduled = Executor.on_wait_timer_scheduled
+
+    def fire_immediately(
+        self: Executor, execution_arn: str, operation_id: str, delay: float
+    ) -> None:
+        on_wait_timer_scheduled(self, execution_arn, operation_id, delay=0)
+
+    monkeypatch.setattr(Executor, "on_wait_timer_scheduled", fire_immediately)
+
     @durable_step
     def one(step_context: StepContext, a: int, b: int) -> str:
         # print("[DEBUG] one called")
@@ -70,7 +82,7 @@ def test_basic_durable_function() -> None:
         return results
 
     with DurableFunctionTestRunner(handler=function_under_test) as runner:
-        result: DurableFunctionTestResult = runner.run(input="input str", timeout=10)
+        result: DurableFunctionTestResult = runner.run(input="input str", timeout=2)
 
     assert result.status is InvocationStatus.SUCCEEDED
     assert result.result == json.dumps(["1 2", "3 4 4 3", "5 6"])
@@ -1,6 +1,7 @@
 """Unit tests for executor module."""
 
 import asyncio
+import re
 from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
@@ -52,6 +53,9 @@ from aws_durable_execution_sdk_python_testing.token import (
 )
 
 
+_ERR_CALLBACK_ID_REQUIRED = re.compile(r"callback_id is required")
+
+
 class MockExecutionObserver(ExecutionObserver):
     """Mock observer to capture execution events through public callbacks."""
 
@@ -2367,13 +2371,13 @@ def test_send_callback_success(executor, mock_store):
 
 def test_send_callback_success_empty_callback_id(executor):
     """Test send_callback_success with empty callback_id."""
-    with pytest.raises(InvalidParameterValueException, match="callback_id is required"):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_CALLBACK_ID_REQUIRED):
         executor.send_callback_success("")
 
 
 def test_send_callback_success_none_callback_id(executor):
     """Test send_callback_success with None callback_id."""
-    with pytest.raises(InvalidParameterValueException, match="callback_id is required"):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_CALLBACK_ID_REQUIRED):
         executor.send_callback_success(None)
 
 
@@ -2428,13 +2432,13 @@ def test_send_callback_failure(executor, mock_store):
 
 def test_send_callback_failure_empty_callback_id(executor):
     """Test send_callback_failure with empty callback_id."""
-    with pytest.raises(InvalidParameterValueException, match="callback_id is required"):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_CALLBACK_ID_REQUIRED):
         executor.send_callback_failure("")
 
 
 def test_send_callback_failure_none_callback_id(executor):
     """Test send_callback_failure with None callback_id."""
-    with pytest.raises(InvalidParameterValueException, match="callback_id is required"):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_CALLBACK_ID_REQUIRED):
         executor.send_callback_failure(None)
 
 
@@ -2485,13 +2489,13 @@ def test_send_callback_heartbeat(executor, mock_store):
 
 def test_send_callback_heartbeat_empty_callback_id(executor):
     """Test send_callback_heartbeat with empty callback_id."""
-    with pytest.raises(InvalidParameterValueException, match="callback_id is required"):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_CALLBACK_ID_REQUIRED):
         executor.send_callback_heartbeat("")
 
 
 def test_send_callback_heartbeat_none_callback_id(executor):
     """Test send_callback_heartbeat with None callback_id."""
-    with pytest.raises(InvalidParameterValueException, match="callback_id is required"):
+    with pytest.raises(InvalidParameterValueException, match=_ERR_CALLBACK_ID_REQUIRED):
         executor.send_callback_heartbeat(None)
 
 
@@ -10,6 +10,7 @@ from aws_durable_execution_sdk_python.lambda_service import (
     CallbackDetails,
     ChainedInvokeDetails,
     ContextDetails,
+    ErrorObject,
     ExecutionDetails,
     OperationStatus,
     OperationType,
@@ -17,6 +18,7 @@ from aws_durable_execution_sdk_python.lambda_service import (
     WaitDetails,
 )
 from aws_durable_execution_sdk_python.lambda_service import Operation as SvcOperation
+from botocore.exceptions import ClientError  # type: ignore
 
 from aws_durable_execution_sdk_python_testing.exceptions import (
     DurableFunctionsTestError,
@@ -25,15 +27,20 @@ from aws_durable_execution_sdk_python_testing.exceptions import (
 )
 from aws_durable_execution_sdk_python_testing.execution import Execution
 from aws_durable_execution_sdk_python_testing.model import (
+    Event,
+    EventResult,
+    GetDurableExecutionHistoryResponse,
+    GetDurableExecutionResponse,
     StartDurableExecutionInput,
     StartDurableExecutionOutput,
-    GetDurableExecutionHistoryResponse,
+    StepSucceededDetails,
 )
 from aws_durable_execution_sdk_python_testing.runner import (
     OPERATION_FACTORIES,
     CallbackOperation,
     ContextOperation,
     DurableChildContextTestRunner,
+    DurableFunctionCloudTestRunner,
     DurableFunctionTestResult,
     DurableFunctionTestRunner,
     ExecutionOperation,
@@ -1033,21 +1040,6 @@ def test_durable_child_context_test_runner_init_with_args(
 
 def test_durable_function_test_result_from_execution_history():
     """Test DurableFunctionTestResult.from_execution_history factory method."""
-    import datetime
-
-    from aws_durable_execution_sdk_python.execution import InvocationStatus
-
-    from aws_durable_execution_sdk_python_testing.model import (
-        Event,
-        EventResult,
-        GetDurableExecutionHistoryResponse,
-        GetDurableExecutionResponse,
-        StepSucceededDetails,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionTestResult,
-    )
-
     execution_response = GetDurableExecutionResponse(
         durable_execution_arn="arn:aws:lambda:us-east-1:123456789012:function:test:execution:exec-1",
         durable_execution_name="test-execution",
@@ -1103,10 +1095,6 @@ def test_durable_function_test_result_from_execution_history():
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_init(mock_boto3):
     """Test DurableFunctionCloudTestRunner initialization."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1125,12 +1113,6 @@ def test_cloud_runner_init(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_run_success(mock_boto3):
     """Test DurableFunctionCloudTestRunner.run with successful execution."""
-    from aws_durable_execution_sdk_python.execution import InvocationStatus
-
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1174,13 +1156,6 @@ def test_cloud_runner_run_success(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_run_invoke_failure(mock_boto3):
     """Test DurableFunctionCloudTestRunner.run with invoke failure."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
     mock_client.invoke.side_effect = Exception("Invoke failed")
@@ -1197,10 +1172,6 @@ def test_cloud_runner_run_invoke_failure(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.time")
 def test_cloud_runner_wait_for_completion_timeout(mock_time, mock_boto3):
     """Test DurableFunctionCloudTestRunner._wait_for_completion with timeout."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
     mock_time.time.side_effect = [0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
@@ -1223,19 +1194,6 @@ def test_cloud_runner_wait_for_completion_timeout(mock_time, mock_boto3):
 
 def test_durable_function_test_result_from_execution_history_with_exception():
     """Test from_execution_history handles events_to_operations exception."""
-    import datetime
-
-    from aws_durable_execution_sdk_python.execution import InvocationStatus
-
-    from aws_durable_execution_sdk_python_testing.model import (
-        Event,
-        GetDurableExecutionHistoryResponse,
-        GetDurableExecutionResponse,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionTestResult,
-    )
-
     execution_response = GetDurableExecutionResponse(
         durable_execution_arn="arn:aws:lambda:us-east-1:123456789012:function:test:execution:exec-1",
         durable_execution_name="test-execution",
@@ -1267,10 +1225,6 @@ def test_durable_function_test_result_from_execution_history_with_exception():
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_completion_failed_status(mock_boto3):
     """Test DurableFunctionCloudTestRunner._wait_for_completion with FAILED status."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1293,13 +1247,6 @@ def test_cloud_runner_wait_for_completion_failed_status(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_run_bad_status_code(mock_boto3):
     """Test DurableFunctionCloudTestRunner.run with bad HTTP status code."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1319,13 +1266,6 @@ def test_cloud_runner_run_bad_status_code(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_run_function_error(mock_boto3):
     """Test DurableFunctionCloudTestRunner.run with function error."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1363,13 +1303,6 @@ def test_cloud_runner_run_function_error(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_run_missing_execution_arn(mock_boto3):
     """Test DurableFunctionCloudTestRunner.run with missing execution ARN."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1389,13 +1322,6 @@ def test_cloud_runner_run_missing_execution_arn(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_completion_get_execution_failure(mock_boto3):
     """Test DurableFunctionCloudTestRunner._wait_for_completion with API failure."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
     mock_client.get_durable_execution.side_effect = Exception("API error")
@@ -1410,19 +1336,6 @@ def test_cloud_runner_wait_for_completion_get_execution_failure(mock_boto3):
 
 def test_durable_function_test_result_from_execution_history_filters_execution_type():
     """Test from_execution_history filters out EXECUTION type operations."""
-    import datetime
-
-    from aws_durable_execution_sdk_python.execution import InvocationStatus
-
-    from aws_durable_execution_sdk_python_testing.model import (
-        Event,
-        GetDurableExecutionHistoryResponse,
-        GetDurableExecutionResponse,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionTestResult,
-    )
-
     execution_response = GetDurableExecutionResponse(
         durable_execution_arn="arn:aws:lambda:us-east-1:123456789012:function:test:execution:exec-1",
         durable_execution_name="test-execution",
@@ -1452,18 +1365,6 @@ def test_durable_function_test_result_from_execution_history_filters_execution_t
 
 def test_durable_function_test_result_from_execution_history_unknown_status():
     """Test from_execution_history with unknown status defaults to FAILED."""
-    import datetime
-
-    from aws_durable_execution_sdk_python.execution import InvocationStatus
-
-    from aws_durable_execution_sdk_python_testing.model import (
-        GetDurableExecutionHistoryResponse,
-        GetDurableExecutionResponse,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionTestResult,
-    )
-
     execution_response = GetDurableExecutionResponse(
         durable_execution_arn="arn:aws:lambda:us-east-1:123456789012:function:test:execution:exec-1",
         durable_execution_name="test-execution",
@@ -1483,19 +1384,6 @@ def test_durable_function_test_result_from_execution_history_unknown_status():
 
 def test_durable_function_test_result_from_execution_history_with_parent_operations():
     """Test from_execution_history filters operations with parent_id."""
-    import datetime
-
-    from aws_durable_execution_sdk_python.execution import InvocationStatus
-
-    from aws_durable_execution_sdk_python_testing.model import (
-        Event,
-        GetDurableExecutionHistoryResponse,
-        GetDurableExecutionResponse,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionTestResult,
-    )
-
     execution_response = GetDurableExecutionResponse(
         durable_execution_arn="arn:aws:lambda:us-east-1:123456789012:function:test:execution:exec-1",
         durable_execution_name="test-execution",
@@ -1536,19 +1424,6 @@ def test_durable_function_test_result_from_execution_history_with_parent_operati
 
 def test_durable_function_test_result_from_execution_history_failed():
     """Test from_execution_history with failed execution."""
-    import datetime
-
-    from aws_durable_execution_sdk_python.execution import InvocationStatus
-    from aws_durable_execution_sdk_python.lambda_service import ErrorObject
-
-    from aws_durable_execution_sdk_python_testing.model import (
-        GetDurableExecutionHistoryResponse,
-        GetDurableExecutionResponse,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionTestResult,
-    )
-
     execution_response = GetDurableExecutionResponse(
         durable_execution_arn="arn:aws:lambda:us-east-1:123456789012:function:test:execution:exec-1",
         durable_execution_name="test-execution",
@@ -1574,10 +1449,6 @@ def test_durable_function_test_result_from_execution_history_failed():
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_completion_timed_out_status(mock_boto3):
     """Test DurableFunctionCloudTestRunner._wait_for_completion with TIMED_OUT status."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1599,10 +1470,6 @@ def test_cloud_runner_wait_for_completion_timed_out_status(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_completion_aborted_status(mock_boto3):
     """Test DurableFunctionCloudTestRunner._wait_for_completion with ABORTED status."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1624,10 +1491,6 @@ def test_cloud_runner_wait_for_completion_aborted_status(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_run_async_success(mock_boto3):
     """Test DurableFunctionCloudTestRunner.run_async with successful invocation."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1654,10 +1517,6 @@ def test_cloud_runner_run_async_success(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_run_async_with_400(mock_boto3):
     """Test DurableFunctionCloudTestRunner.run_async with successful invocation."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1677,13 +1536,6 @@ def test_cloud_runner_run_async_with_400(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_run_async_failure(mock_boto3):
     """Test DurableFunctionCloudTestRunner.run_async with invocation failure."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
     mock_client.invoke.side_effect = Exception("Async invoke failed")
@@ -1699,10 +1551,6 @@ def test_cloud_runner_run_async_failure(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_send_callback_success(mock_boto3):
     """Test DurableFunctionCloudTestRunner.send_callback_success."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1717,10 +1565,6 @@ def test_cloud_runner_send_callback_success(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_send_callback_failure(mock_boto3):
     """Test DurableFunctionCloudTestRunner.send_callback_failure."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1735,10 +1579,6 @@ def test_cloud_runner_send_callback_failure(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_send_callback_heartbeat(mock_boto3):
     """Test DurableFunctionCloudTestRunner.send_callback_heartbeat."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1753,13 +1593,6 @@ def test_cloud_runner_send_callback_heartbeat(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_send_callback_error(mock_boto3):
     """Test DurableFunctionCloudTestRunner callback methods with API errors."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
     mock_client.send_durable_execution_callback_success.side_effect = Exception(
@@ -1777,10 +1610,6 @@ def test_cloud_runner_send_callback_error(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_callback_success(mock_boto3):
     """Test DurableFunctionCloudTestRunner.wait_for_callback success."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1807,10 +1636,6 @@ def test_cloud_runner_wait_for_callback_success(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_callback_none(mock_boto3):
     """Test DurableFunctionCloudTestRunner.wait_for_callback none."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1837,10 +1662,6 @@ def test_cloud_runner_wait_for_callback_none(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_callback_success_without_name(mock_boto3):
     """Test DurableFunctionCloudTestRunner.wait_for_callback success."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1867,10 +1688,6 @@ def test_cloud_runner_wait_for_callback_success_without_name(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_callback_all_done_without_name(mock_boto3):
     """Test DurableFunctionCloudTestRunner.wait_for_callback all_done_without_name."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -1900,11 +1717,15 @@ def test_cloud_runner_wait_for_callback_all_done_without_name(mock_boto3):
 
 
 @patch("aws_durable_execution_sdk_python_testing.runner.Executor")
-def test_local_runner_wait_for_callback_all_done_without_name(mock_executor_class):
+@patch("aws_durable_execution_sdk_python_testing.runner.time")
+def test_local_runner_wait_for_callback_all_done_without_name(
+    mock_time, mock_executor_class
+):
     """Test DurableFunctionCloudTestRunner.wait_for_callback all_done_without_name."""
     handler = Mock()
     mock_executor = Mock()
     mock_executor_class.return_value = mock_executor
+    mock_time.time.side_effect = [0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
     mock_executor.get_execution_history.return_value = (
         GetDurableExecutionHistoryResponse.from_dict(
             {
@@ -1948,13 +1769,16 @@ def test_local_runner_wait_for_callback_with_exception(mock_executor_class):
 
 
 @patch("aws_durable_execution_sdk_python_testing.runner.Executor")
+@patch("aws_durable_execution_sdk_python_testing.runner.time")
 def test_local_runner_wait_for_callback_with_resource_not_found_exception(
+    mock_time,
     mock_executor_class,
 ):
     """Test DurableFunctionCloudTestRunner.wait_for_callback with resource_not_found exception"""
     handler = Mock()
     mock_executor = Mock()
     mock_executor_class.return_value = mock_executor
+    mock_time.time.side_effect = [0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
     mock_executor.get_execution_history.side_effect = ResourceNotFoundException("error")
 
     runner = DurableFunctionTestRunner(handler)
@@ -1966,10 +1790,6 @@ def test_local_runner_wait_for_callback_with_resource_not_found_exception(
 @patch("aws_durable_execution_sdk_python_testing.runner.time")
 def test_cloud_runner_wait_for_callback_timeout(mock_time, mock_boto3):
     """Test DurableFunctionCloudTestRunner.wait_for_callback timeout."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
     mock_time.time.side_effect = [0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
@@ -1987,10 +1807,6 @@ def test_cloud_runner_wait_for_callback_timeout(mock_time, mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_callback_already_completed(mock_boto3):
     """Test DurableFunctionCloudTestRunner.wait_for_callback already completed."""
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -2025,11 +1841,6 @@ def test_cloud_runner_wait_for_callback_already_completed(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_callback_client_error_retryable(mock_boto3):
     """Test wait_for_callback with retryable ClientError."""
-    from botocore.exceptions import ClientError  # type: ignore
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -2065,14 +1876,6 @@ def test_cloud_runner_wait_for_callback_client_error_non_retryable(
     mock_boto3,
 ):
     """Test wait_for_callback with non-retryable ClientError."""
-    from botocore.exceptions import ClientError
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -2092,13 +1895,6 @@ def test_cloud_runner_wait_for_callback_client_error_non_retryable(
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_callback_generic_exception(mock_boto3):
     """Test wait_for_callback with generic Exception."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -2115,13 +1911,6 @@ def test_cloud_runner_wait_for_callback_generic_exception(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_result_fetch_history_exception(mock_boto3):
     """Test wait_for_result with exception in _fetch_execution_history."""
-    from aws_durable_execution_sdk_python_testing.exceptions import (
-        DurableFunctionsTestError,
-    )
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -2146,11 +1935,6 @@ def test_cloud_runner_wait_for_result_fetch_history_exception(mock_boto3):
 @patch("aws_durable_execution_sdk_python_testing.runner.boto3")
 def test_cloud_runner_wait_for_result_success(mock_boto3):
     """Test wait_for_result successful execution."""
-    from aws_durable_execution_sdk_python.execution import InvocationStatus
-    from aws_durable_execution_sdk_python_testing.runner import (
-        DurableFunctionCloudTestRunner,
-    )
-
     mock_client = Mock()
     mock_boto3.client.return_value = mock_client
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from unittest.mock import Mock, patch
 
 import pytest
@@ -20,6 +21,10 @@ from aws_durable_execution_sdk_python_testing.runner import (
 from aws_durable_execution_sdk_python_testing.web.server import WebServiceConfig
 
 
+_ERR_SERVER_NOT_STARTED = re.compile(r"Server not started")
+_ERR_SERVER_ALREADY_RUNNING = re.compile(r"Server is already running")
+
+
 def test_should_create_config_with_web_service_and_defaults():
     """Test creating WebRunnerConfig with WebServiceConfig and default Lambda settings."""
     # Arrange
@@ -325,7 +330,7 @@ def test_should_initialize_runner_in_stopped_state():
 
     # Assert - Test through public behavior
     # Should raise DurableFunctionsLocalRunnerError when trying to serve before starting
-    with pytest.raises(DurableFunctionsLocalRunnerError, match="Server not started"):
+    with pytest.raises(DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED):
         runner.serve_forever()
 
     # Should be safe to call stop multiple times (no-op when not started)
@@ -518,7 +523,7 @@ def test_should_raise_runtime_error_on_double_start():
 
         # Act & Assert - Second start should raise DurableFunctionsLocalRunnerError
         with pytest.raises(
-            DurableFunctionsLocalRunnerError, match="Server is already running"
+            DurableFunctionsLocalRunnerError, match=_ERR_SERVER_ALREADY_RUNNING
         ):
             runner.start()
 
@@ -534,7 +539,7 @@ def test_should_raise_runtime_error_when_serve_before_start():
     runner = WebRunner(runner_config)
 
     # Act & Assert - serve_forever before start should raise DurableFunctionsLocalRunnerError
-    with pytest.raises(DurableFunctionsLocalRunnerError, match="Server not started"):
+    with pytest.raises(DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED):
         runner.serve_forever()
 
 
@@ -995,7 +1000,7 @@ def test_should_handle_standard_runtime_errors():
             runner.start()
 
     # Test DurableFunctionsLocalRunnerError when serve_forever called before start
-    with pytest.raises(DurableFunctionsLocalRunnerError, match="Server not started"):
+    with pytest.raises(DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED):
         runner.serve_forever()
 
 
@@ -1118,7 +1123,7 @@ def test_start_raises_runtime_error_if_already_started():
 
     # Act & Assert
     with pytest.raises(
-        DurableFunctionsLocalRunnerError, match="Server is already running"
+        DurableFunctionsLocalRunnerError, match=_ERR_SERVER_ALREADY_RUNNING
     ):
         runner.start()
 
@@ -1166,7 +1171,7 @@ def test_serve_forever_raises_runtime_error_if_not_started():
     assert runner._server is None  # noqa: SLF001
 
     # Act & Assert
-    with pytest.raises(DurableFunctionsLocalRunnerError, match="Server not started"):
+    with pytest.raises(DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED):
         runner.serve_forever()
 
 
@@ -1207,7 +1212,7 @@ def test_stop_cleans_up_server_and_scheduler():
 
         # Verify runner is back to stopped state (public behavior)
         with pytest.raises(
-            DurableFunctionsLocalRunnerError, match="Server not started"
+            DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED
         ):
             runner.serve_forever()
 
@@ -1251,7 +1256,7 @@ def test_stop_is_safe_to_call_multiple_times():
 
         # Verify runner remains in stopped state (public behavior)
         with pytest.raises(
-            DurableFunctionsLocalRunnerError, match="Server not started"
+            DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED
         ):
             runner.serve_forever()
 
@@ -1612,7 +1617,7 @@ def test_stop_handles_unstarted_runner_gracefully():
     runner.stop()
 
     # Verify runner remains in stopped state (public behavior)
-    with pytest.raises(DurableFunctionsLocalRunnerError, match="Server not started"):
+    with pytest.raises(DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED):
         runner.serve_forever()
 
 
@@ -1654,7 +1659,7 @@ def test_complete_lifecycle_start_serve_stop():
 
         # Verify runner is back to stopped state (public behavior)
         with pytest.raises(
-            DurableFunctionsLocalRunnerError, match="Server not started"
+            DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED
         ):
             runner.serve_forever()
 
@@ -1711,7 +1716,7 @@ def test_state_transitions_prevent_invalid_operations():
     runner = WebRunner(runner_config)
 
     # Test serve_forever before start
-    with pytest.raises(DurableFunctionsLocalRunnerError, match="Server not started"):
+    with pytest.raises(DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED):
         runner.serve_forever()
 
     # Mock dependencies for start
@@ -1737,7 +1742,7 @@ def test_state_transitions_prevent_invalid_operations():
 
         # Test double start
         with pytest.raises(
-            DurableFunctionsLocalRunnerError, match="Server is already running"
+            DurableFunctionsLocalRunnerError, match=_ERR_SERVER_ALREADY_RUNNING
         ):
             runner.start()
 
@@ -1748,6 +1753,6 @@ def test_state_transitions_prevent_invalid_operations():
         # Stop and verify serve_forever fails again
         runner.stop()
         with pytest.raises(
-            DurableFunctionsLocalRunnerError, match="Server not started"
+            DurableFunctionsLocalRunnerError, match=_ERR_SERVER_NOT_STARTED
         ):
             runner.serve_forever()
@@ -2,7 +2,7 @@
 
 import threading
 import time
-from concurrent.futures import Future
+from concurrent.futures import Future, wait
 from unittest.mock import patch
 
 import pytest
@@ -19,6 +19,19 @@ def wait_for_condition(condition_func, timeout_iterations=100):
     return False
 
 
+def drain_loop(scheduler):
+    """Block until callbacks already queued on the scheduler loop have run.
+
+    The loop runs callbacks in FIFO order, so a no-op scheduled now finishes
+    after anything queued earlier, such as an event removal.
+    """
+
+    async def noop():
+        pass
+
+    scheduler.call_later(noop).result(timeout=1)
+
+
 def test_scheduler_init():
     """Test Scheduler initialization."""
     scheduler = Scheduler()
@@ -85,7 +98,7 @@ def test_scheduler_event_count():
 
     # Remove event
     event1.remove()
-    wait_for_condition(lambda: scheduler.event_count() == 1)
+    drain_loop(scheduler)
     assert scheduler.event_count() == 1
 
     scheduler.stop()
@@ -102,12 +115,12 @@ def test_scheduler_task_count():
 
     # Create tasks with longer delay to ensure they're counted
     future1 = scheduler.call_later(lambda: None, delay=0.5)
-    # Give a moment for the task to be created
-    time.sleep(0.01)
+    # Let the loop create the task
+    drain_loop(scheduler)
     assert scheduler.task_count() >= 1
 
     future2 = scheduler.call_later(lambda: None, delay=0.5)
-    time.sleep(0.01)
+    drain_loop(scheduler)
     assert scheduler.task_count() >= 2
 
     # Cancel tasks to clean up
@@ -131,7 +144,7 @@ def test_scheduler_call_later_sync_function():
         result.append("executed")
 
     future = scheduler.call_later(sync_func, delay=0.01)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     assert isinstance(future, Future)
     assert result == ["executed"]
@@ -151,7 +164,7 @@ def test_scheduler_call_later_async_function():
         result.append("async_executed")
 
     future = scheduler.call_later(async_func, delay=0.01)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     assert isinstance(future, Future)
     assert result == ["async_executed"]
@@ -172,7 +185,7 @@ def test_scheduler_call_later_multiple_count():
 
     # Note: Current implementation only executes once due to early return
     future = scheduler.call_later(func, delay=0.01, count=3)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     # Current implementation only executes once
     assert len(result) == 1
@@ -193,7 +206,7 @@ def test_scheduler_call_later_infinite_count():
 
     # Note: Current implementation only executes once due to early return
     future = scheduler.call_later(func, delay=0.01, count=None)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     # Current implementation only executes once
     assert len(result) == 1
@@ -216,7 +229,7 @@ def test_scheduler_call_later_function_exception():
         "aws_durable_execution_sdk_python_testing.scheduler.logger"
     ) as mock_logger:
         future = scheduler.call_later(failing_func, delay=0.01)
-        wait_for_condition(lambda: future.done())
+        wait([future], timeout=1)
 
         assert future.done()
         mock_logger.exception.assert_called()
@@ -248,8 +261,8 @@ def test_task_cancel():
     future = scheduler.call_later(func, delay=0.1, count=None)
     future.cancel()
 
-    # Wait briefly for cancellation to take effect
-    wait_for_condition(lambda: future.cancelled())
+    # Cancelled futures count as done, so this returns once cancellation lands
+    wait([future], timeout=1)
 
     assert future.cancelled()
 
@@ -267,11 +280,10 @@ def test_task_is_done():
     future = scheduler.call_later(quick_func, delay=0.01)
     assert not future.done()
 
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
     assert future.done()
 
-    # Small delay to ensure coroutine cleanup completes
-    time.sleep(0.01)
+    drain_loop(scheduler)
     scheduler.stop()
 
 
@@ -284,7 +296,7 @@ def test_task_result():
         return None
 
     future = scheduler.call_later(func, delay=0.01)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     result = future.result()
     assert result is None
@@ -316,11 +328,10 @@ def test_task_result_completed():
         return "test_result"
 
     future = scheduler.call_later(func, delay=0.01)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
     assert future.done()
 
-    # Small delay to ensure coroutine cleanup completes
-    time.sleep(0.01)
+    drain_loop(scheduler)
     scheduler.stop()
 
 
@@ -401,7 +412,7 @@ def test_event_remove():
     assert scheduler.event_count() == 1
 
     event.remove()
-    wait_for_condition(lambda: scheduler.event_count() == 0)
+    drain_loop(scheduler)
 
     assert scheduler.event_count() == 0
 
@@ -415,7 +426,7 @@ def test_event_wait_removed_event():
 
     event = scheduler.create_event()
     event.remove()
-    wait_for_condition(lambda: scheduler.event_count() == 0)
+    drain_loop(scheduler)
 
     result = event.wait(timeout=0.01)
     assert result is False
@@ -430,7 +441,7 @@ def test_event_set_removed_event():
 
     event = scheduler.create_event()
     event.remove()
-    wait_for_condition(lambda: scheduler.event_count() == 0)
+    drain_loop(scheduler)
 
     # Should not crash
     event.set()
@@ -485,7 +496,7 @@ def test_task_properties_after_scheduler_stop():
         pass
 
     future = scheduler.call_later(func, delay=0.01)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     scheduler.stop()
 
@@ -521,7 +532,7 @@ def test_scheduler_call_later_zero_delay():
         result.append("zero_delay")
 
     future = scheduler.call_later(func, delay=0)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     assert result == ["zero_delay"]
     assert future.done()
@@ -540,7 +551,7 @@ def test_scheduler_call_later_default_parameters():
         result.append("default")
 
     future = scheduler.call_later(func)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     assert result == ["default"]
     assert future.done()
@@ -563,7 +574,7 @@ def test_task_result_with_exception():
         "aws_durable_execution_sdk_python_testing.scheduler.logger"
     ) as mock_logger:
         future = scheduler.call_later(failing_func, delay=0.01)
-        wait_for_condition(lambda: future.done())
+        wait([future], timeout=1)
 
         # Future should be done and exception should be logged
         assert future.done()
@@ -585,7 +596,7 @@ def test_get_task_result_exception_handling():
         pass
 
     future = scheduler.call_later(func, delay=0.01)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     # Future result should work normally
     result = future.result()
@@ -605,7 +616,7 @@ def test_call_later_with_sync_function():
         result.append("sync_executed")
 
     future = scheduler.call_later(sync_function, delay=0.01)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     assert result == ["sync_executed"]
     assert future.done()
@@ -624,7 +635,7 @@ def test_call_later_with_async_function():
         result.append("async_executed")
 
     future = scheduler.call_later(async_function, delay=0.01)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     assert result == ["async_executed"]
     assert future.done()
@@ -685,7 +696,7 @@ def test_call_later_multiple_iterations():
 
     # Use a very small delay and count=3 to test the loop
     future = scheduler.call_later(func, delay=0.001, count=3)
-    wait_for_condition(lambda: future.done(), timeout_iterations=500)
+    wait([future], timeout=1)
 
     # Should execute at least once
     assert len(result) >= 1
@@ -720,7 +731,7 @@ def test_call_later_loop_exit_condition():
 
     # Test with count=0 to hit the loop exit condition
     future = scheduler.call_later(func, delay=0.01, count=0)
-    wait_for_condition(lambda: future.done())
+    wait([future], timeout=1)
 
     # Should not execute the function at all
     assert len(result) == 0
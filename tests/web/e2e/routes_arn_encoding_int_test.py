@@ -9,7 +9,6 @@ the store lookup hits.
 from __future__ import annotations
 
 import threading
-import time
 from typing import Any
 
 import boto3  # type: ignore
@@ -65,8 +64,19 @@ def _assert_no_percent_encoding_in_error(exc: ClientError, arn: str) -> None:
     )
 
 
+@pytest.fixture(scope="module")
+def scheduler():
+    """Yield one started Scheduler for the module.
+
+    Only the event-loop thread is shared. Every test still gets its own
+    store, executor and server, so no execution state crosses tests.
+    """
+    with Scheduler() as scheduler:
+        yield scheduler
+
+
 @pytest.fixture
-def server_with_slash_arn():
+def server_with_slash_arn(scheduler):
     """Yield ``(boto_client, arn, executor, store)`` for a live WebServer.
 
     The yielded ARN contains a literal ``/`` matching the v1.2.0+ format
@@ -74,7 +84,6 @@ def server_with_slash_arn():
     so read paths have something to find.
     """
     store = InMemoryExecutionStore()
-    scheduler = Scheduler()
     checkpoint_processor = CheckpointProcessor(store=store, scheduler=scheduler)
     executor = Executor(
         store=store,
@@ -83,7 +92,6 @@ def server_with_slash_arn():
         checkpoint_processor=checkpoint_processor,
     )
     checkpoint_processor.add_execution_observer(executor)
-    scheduler.start()
 
     # Hand-build a started Execution whose ARN contains '/' so we control
     # the format under test without going through executor.start_execution
@@ -108,9 +116,8 @@ def server_with_slash_arn():
     server = WebServer(config, executor)
     port = server.server_address[1]
     server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    # WebServer binds and listens in __init__, so the client can connect at once.
     server_thread.start()
-    # Give the listener a beat to come up before the boto client connects.
-    time.sleep(0.05)
 
     client = boto3.client(
         "lambda",
@@ -126,7 +133,6 @@ def server_with_slash_arn():
     finally:
         server.shutdown()
         server.server_close()
-        scheduler.stop()
 
 
 def test_get_durable_execution_decodes_slash_in_arn(server_with_slash_arn):
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import logging
 import threading
-import time
 from unittest.mock import Mock, patch
+from urllib.request import urlopen
 
 import pytest
 
@@ -99,15 +99,15 @@ def test_web_server_background_usage():
         server_thread = threading.Thread(target=server.serve_forever, daemon=True)
         server_thread.start()
 
-        # Give it a moment to start
-        time.sleep(0.1)
+        # A health response means serve_forever is running, so shutdown cannot
+        # race it. The socket itself is already listening after __init__.
+        host, port = server.server_address[:2]
+        with urlopen(f"http://{host}:{port}/health", timeout=1) as response:  # noqa: S310
+            assert response.status == 200
         assert server_thread.is_alive()
 
-        # Stop the server
+        # shutdown blocks until serve_forever returns
         server.shutdown()
-
-        # Give it a moment to shutdown
-        time.sleep(0.1)
         server_thread.join(timeout=1)
         assert not server_thread.is_alive()
 